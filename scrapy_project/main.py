@@ -11,16 +11,33 @@ Usage:
 """
 
 import argparse
+import importlib
+import re
 import sys
 from pathlib import Path
 
 # Add project to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from my_scraper.spider_manager import SpiderManager
-from my_scraper.cli_interface import CLIInterface, SpiderMenuInterface
-from my_scraper.settings_manager import SettingsManager
-from my_scraper.settings_menu import SettingsMenu
+# Heavy my_scraper modules (Scrapy, Twisted, lxml, ...) are imported lazily so
+# argparse-only paths like --help and --list don't pay their startup cost
+_LAZY = True
+
+# --args "key1=value1,key2=value2" parser; values may themselves contain '='
+# (e.g. URLs with query strings), only ',' separates pairs
+_ARG_RE = re.compile(r"\s*([^=,\s]+)\s*=\s*([^,]*?)\s*(?:,|$)")
+
+# Lazily imported and cached on the first error path that needs it
+_traceback = None
+
+
+def _tb():
+    """Get the traceback module, importing it on first use"""
+    global _traceback
+    if _traceback is None:
+        import traceback
+        _traceback = traceback
+    return _traceback
 
 
 class ScraperApplication:
@@ -29,36 +46,110 @@ class ScraperApplication:
     def __init__(self):
         """Initialize the scraper application"""
         self.project_dir = Path(__file__).parent
-        self.spider_manager = SpiderManager(self.project_dir)
-        self.cli = CLIInterface(width=80)
-        self.menu = SpiderMenuInterface(self.cli)
+        self._spider_manager = None
+        self._cli = None
+        self._menu = None
+        self._spiders_cache = None
+        self._spiders_signature = None
+        self._extra_options_cache = None
+        self._extra_options_count = None
+
+    @property
+    def spider_manager(self):
+        """Lazily create the SpiderManager (imports Scrapy on first use)"""
+        if self._spider_manager is None:
+            module = importlib.import_module('my_scraper.spider_manager')
+            self._spider_manager = module.SpiderManager(self.project_dir)
+        return self._spider_manager
+
+    @property
+    def cli(self):
+        """Lazily create the CLI interface"""
+        if self._cli is None:
+            module = importlib.import_module('my_scraper.cli_interface')
+            self._cli = module.CLIInterface(width=80)
+        return self._cli
+
+    @property
+    def menu(self):
+        """Lazily create the spider menu interface"""
+        if self._menu is None:
+            module = importlib.import_module('my_scraper.cli_interface')
+            self._menu = module.SpiderMenuInterface(self.cli)
+        return self._menu
+
+    def _spiders_dir_signature(self):
+        """Cheap validity check: mtimes of the spider files on disk"""
+        spiders_dir = self.project_dir / 'my_scraper' / 'spiders'
+        try:
+            return tuple(sorted(
+                (f.name, f.stat().st_mtime) for f in spiders_dir.glob('*_spider.py')
+            ))
+        except OSError:
+            return None
+
+    def _spiders(self):
+        """
+        Get the detected spiders, cached across menu iterations
+
+        The cache is reused as long as the spider files' mtimes are
+        unchanged; otherwise the spiders are re-detected.
+        """
+        signature = self._spiders_dir_signature()
+
+        if self._spiders_cache is None or signature != self._spiders_signature:
+            if self._spiders_cache is not None:
+                # Spider files changed - force a fresh detection pass
+                self._spider_manager = None
+            self._spiders_cache = self.spider_manager.get_all_spiders()
+            self._spiders_signature = signature
+
+        return self._spiders_cache
+
+    def _invalidate_spiders_cache(self):
+        """Drop the cached spider list so the next access re-detects"""
+        self._spiders_cache = None
+        self._extra_options_cache = None
+
+    def _extra_options(self, num_spiders: int):
+        """Get the static menu options, rebuilt only when the count changes"""
+        if self._extra_options_cache is None or self._extra_options_count != num_spiders:
+            self._extra_options_cache = [
+                (num_spiders + 1, "Run ALL Spiders", "Execute all spiders in sequence"),
+                (num_spiders + 2, "Settings Menu", "Configure scraper performance settings"),
+                (0, "Exit", "Quit the application")
+            ]
+            self._extra_options_count = num_spiders
+        return self._extra_options_cache
 
     def list_spiders(self):
         """Display all detected spiders in a formatted table"""
-        spiders = self.spider_manager.get_all_spiders()
+        spiders = self._spiders()
 
         if not spiders:
             self.cli.display_error("No spiders detected!")
             return
 
-        self.cli.display_header("AVAILABLE SPIDERS")
-        print()
+        # Buffer the whole listing into a single stdout write
+        with self.cli.buffered():
+            self.cli.display_header("AVAILABLE SPIDERS")
+            self.cli.display_text()
 
-        # Display in table format
-        for i, spider in enumerate(spiders, 1):
-            print(f"{i}. {spider['name']}")
-            self.cli.display_info("   Description", spider['description'], key_width=18)
+            # Display in table format
+            for i, spider in enumerate(spiders, 1):
+                self.cli.display_text(f"{i}. {spider.name}")
+                self.cli.display_info("   Description", spider.description, key_width=18)
 
-            if spider['parameters']:
-                self.cli.display_info("   Parameters", "", key_width=18)
-                for param_name, param_type, default in spider['parameters']:
-                    default_str = f"(default: {default})" if default != "None" else "(required)"
-                    print(f"      - {param_name} ({param_type}) {default_str}")
+                if spider.parameters:
+                    self.cli.display_info("   Parameters", "", key_width=18)
+                    for param_name, param_type, default in spider.parameters:
+                        default_str = f"(default: {default})" if default != "None" else "(required)"
+                        self.cli.display_text(f"      - {param_name} ({param_type}) {default_str}")
 
-            self.cli.display_info("   Module", f"{spider['module']}.py", key_width=18)
-            print()
+                self.cli.display_info("   Module", f"{spider.module}.py", key_width=18)
+                self.cli.display_text()
 
-        self.cli.display_separator("=")
+            self.cli.display_separator("=")
 
     def run_spider(self, spider_name: str, spider_args: dict = None):
         """
@@ -88,7 +179,7 @@ class ScraperApplication:
 
     def run_all_spiders(self):
         """Run all spiders in sequence"""
-        spiders = self.spider_manager.get_all_spiders()
+        spiders = self._spiders()
 
         if not spiders:
             self.cli.display_error("No spiders detected!")
@@ -106,6 +197,10 @@ class ScraperApplication:
     def open_settings_menu(self):
         """Open the settings configuration menu"""
         try:
+            # Imported here so the settings stack is only loaded when the menu opens
+            from my_scraper.settings_manager import SettingsManager
+            from my_scraper.settings_menu import SettingsMenu
+
             # Get config file path
             config_file = self.project_dir / 'my_scraper' / 'scraper_config.json'
 
@@ -116,33 +211,32 @@ class ScraperApplication:
             # Run the settings menu
             settings_menu.run()
 
+            # Settings may change spider behaviour - re-detect next time
+            self._invalidate_spiders_cache()
+
         except ImportError as e:
             self.cli.display_error(f"Settings menu module not found: {e}")
             print("[!] Make sure settings_manager.py and settings_menu.py are in my_scraper/")
         except Exception as e:
             self.cli.display_error(f"Error opening settings menu: {e}")
-            import traceback
-            traceback.print_exc()
+            _tb().print_exc()
 
     def interactive_menu(self):
         """Display interactive menu for spider selection"""
         while True:
-            spiders = self.spider_manager.get_all_spiders()
+            spiders = self._spiders()
 
-            # Prepare extra options
+            # Extra options are cached alongside the spider list
             num_spiders = len(spiders)
-            extra_options = [
-                (num_spiders + 1, "Run ALL Spiders", "Execute all spiders in sequence"),
-                (num_spiders + 2, "Settings Menu", "Configure scraper performance settings"),
-                (0, "Exit", "Quit the application")
-            ]
+            extra_options = self._extra_options(num_spiders)
+            num_extra_options = len(extra_options)
 
             # Display menu
             self.menu.display_main_menu(spiders, extra_options)
 
             # Get user choice
             try:
-                choice = self.menu.get_spider_choice(num_spiders, len(extra_options))
+                choice = self.menu.get_spider_choice(num_spiders, num_extra_options)
 
                 if choice == '0':
                     print("\n✓ Goodbye!\n")
@@ -174,12 +268,12 @@ class ScraperApplication:
 
                         # Confirm execution
                         if self.cli.confirm("Run this spider?", default=True):
-                            self.run_spider(spider['name'], spider_args)
+                            self.run_spider(spider.name, spider_args)
                             self.cli.pause()
                             break  # Exit after running
 
                 else:
-                    self.cli.display_error(f"Invalid choice! Please select 0-{num_spiders + len(extra_options)}")
+                    self.cli.display_error(f"Invalid choice! Please select 0-{num_spiders + num_extra_options}")
                     self.cli.pause()
 
             except ValueError:
@@ -190,13 +284,39 @@ class ScraperApplication:
                 break
             except Exception as e:
                 self.cli.display_error(f"Unexpected error: {e}")
-                import traceback
-                traceback.print_exc()
+                _tb().print_exc()
                 self.cli.pause()
 
 
-def main():
-    """Main entry point"""
+def _sniff_mode(argv):
+    """
+    Detect the intended mode from raw argv without building a parser
+
+    Args:
+        argv: Argument list (typically sys.argv[1:])
+
+    Returns:
+        One of 'help', 'list', 'spider', 'all', 'interactive'
+    """
+    mode = 'interactive'
+
+    for arg in argv:
+        if arg in ('--help', '-h'):
+            # Help always wins - it needs the full parser for a complete usage
+            return 'help'
+        if mode == 'interactive':
+            if arg in ('--list', '-l'):
+                mode = 'list'
+            elif arg in ('--spider', '-s') or arg.startswith('--spider='):
+                mode = 'spider'
+            elif arg == '--all':
+                mode = 'all'
+
+    return mode
+
+
+def _build_parser_full():
+    """Build the complete parser (used for --help and unknown arguments)"""
     parser = argparse.ArgumentParser(
         description='LLM Metadata Scraper - Automatically detect and run spiders',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -235,32 +355,88 @@ Examples:
         help='Run all spiders in sequence'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def _build_parser_list():
+    """Build the minimal parser for the --list mode"""
+    parser = argparse.ArgumentParser(
+        description='LLM Metadata Scraper - Automatically detect and run spiders'
+    )
+    parser.add_argument(
+        '--list', '-l',
+        action='store_true',
+        help='List all available spiders'
+    )
+    return parser
+
+
+def _build_parser_spider():
+    """Build the minimal parser for the --spider mode"""
+    parser = argparse.ArgumentParser(
+        description='LLM Metadata Scraper - Automatically detect and run spiders'
+    )
+    parser.add_argument(
+        '--spider', '-s',
+        type=str,
+        help='Run specific spider by name'
+    )
+    parser.add_argument(
+        '--args', '-a',
+        type=str,
+        help='Spider arguments in format: key1=value1,key2=value2'
+    )
+    return parser
+
+
+def _build_parser_all():
+    """Build the minimal parser for the --all mode"""
+    parser = argparse.ArgumentParser(
+        description='LLM Metadata Scraper - Automatically detect and run spiders'
+    )
+    parser.add_argument(
+        '--all',
+        action='store_true',
+        help='Run all spiders in sequence'
+    )
+    return parser
+
+
+def main():
+    """Main entry point"""
+    # Sniff the mode from raw argv so each branch only builds the parser
+    # (and imports the modules) it actually needs
+    mode = _sniff_mode(sys.argv[1:])
+
+    if mode == 'help':
+        # Prints full usage and exits
+        _build_parser_full().parse_args()
+        return
 
-    # Initialize application
-    app = ScraperApplication()
+    if mode == 'list':
+        _build_parser_list().parse_args()
+        ScraperApplication().list_spiders()
 
-    # Handle different modes
-    if args.list:
-        app.list_spiders()
+    elif mode == 'spider':
+        args = _build_parser_spider().parse_args()
 
-    elif args.spider:
-        # Parse spider arguments
+        # Parse spider arguments in a single regex pass
         spider_args = {}
         if args.args:
-            for arg in args.args.split(','):
-                if '=' in arg:
-                    key, value = arg.split('=', 1)
-                    spider_args[key.strip()] = value.strip()
+            spider_args = {m.group(1): m.group(2) for m in _ARG_RE.finditer(args.args)}
 
-        app.run_spider(args.spider, spider_args)
+        ScraperApplication().run_spider(args.spider, spider_args)
 
-    elif args.all:
-        app.run_all_spiders()
+    elif mode == 'all':
+        _build_parser_all().parse_args()
+        ScraperApplication().run_all_spiders()
 
     else:
-        # Interactive menu
-        app.interactive_menu()
+        # Interactive menu - reject stray arguments before starting
+        argparse.ArgumentParser(
+            description='LLM Metadata Scraper - Automatically detect and run spiders'
+        ).parse_args()
+        ScraperApplication().interactive_menu()
 
 
 if __name__ == '__main__':
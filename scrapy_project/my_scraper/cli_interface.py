@@ -3,10 +3,34 @@ CLI Interface Module
 Handles all user interface and menu display logic with fixed-width tables
 """
 
+import functools
 import os
 import sys
+import textwrap
+from contextlib import contextmanager
 from typing import List, Dict, Optional, Callable
 
+# ANSI sequence: clear screen + move cursor to home
+_CLEAR = "\x1b[2J\x1b[H"
+
+_ALIGN_CHARS = {'left': '<', 'right': '>', 'center': '^'}
+
+
+@functools.lru_cache(maxsize=32)
+def _row_template(width: int, padding: int, n_cols: int, align: str) -> str:
+    """Build (and cache) a str.format template for a multi-column row"""
+    align_char = _ALIGN_CHARS.get(align, '<')
+    col_width = (width - (n_cols - 1) * padding) // n_cols
+    pad = " " * padding
+    return pad.join(f"{{:{align_char}{col_width}}}" for _ in range(n_cols))
+
+
+@functools.lru_cache(maxsize=32)
+def _key_value_template(width: int, padding: int, key_width: int) -> str:
+    """Build (and cache) a str.format template for a key-value row"""
+    value_width = width - key_width - padding
+    return f"{{:<{key_width}}}{' ' * padding}{{:<{value_width}}}"
+
 
 class Table:
     """Fixed-width table formatter for consistent CLI display"""
@@ -20,10 +44,13 @@ class Table:
         """
         self.width = width
         self.padding = 2
+        # Precomputed strings for the separators/padding used on every render
+        self._seps = {char: char * width for char in ('=', '-', ' ', '*')}
+        self._pad = " " * self.padding
 
     def separator(self, char: str = "=") -> str:
         """Create a separator line"""
-        return char * self.width
+        return self._seps.get(char) or (char * self.width)
 
     def header(self, text: str, char: str = "=") -> str:
         """Create a centered header"""
@@ -51,25 +78,14 @@ class Table:
             else:
                 return text.ljust(self.width)
 
-        # Multiple columns - distribute evenly
-        col_width = (self.width - (len(columns) - 1) * self.padding) // len(columns)
-        formatted_cols = []
-
-        for col in columns:
-            text = str(col)
-            if align == "center":
-                formatted_cols.append(text.center(col_width))
-            elif align == "right":
-                formatted_cols.append(text.rjust(col_width))
-            else:
-                formatted_cols.append(text.ljust(col_width))
-
-        return (" " * self.padding).join(formatted_cols)
+        # Multiple columns - distribute evenly via a cached format template
+        template = _row_template(self.width, self.padding, len(columns), align)
+        return template.format(*map(str, columns))
 
     def key_value(self, key: str, value: str, key_width: int = 30) -> str:
         """Create a key-value row"""
-        value_width = self.width - key_width - self.padding
-        return f"{str(key).ljust(key_width)}{' ' * self.padding}{str(value).ljust(value_width)}"
+        template = _key_value_template(self.width, self.padding, key_width)
+        return template.format(str(key), str(value))
 
     def numbered_item(self, number: int, text: str, description: str = "") -> str:
         """Create a numbered menu item"""
@@ -86,28 +102,14 @@ class Table:
 
     def wrap_text(self, text: str, indent: int = 0) -> str:
         """Wrap text to fit within table width"""
-        max_width = self.width - indent
-        words = text.split()
-        lines = []
-        current_line = []
-        current_length = 0
-
-        for word in words:
-            word_length = len(word) + 1  # +1 for space
-            if current_length + word_length > max_width:
-                if current_line:
-                    lines.append(" ".join(current_line))
-                current_line = [word]
-                current_length = len(word)
-            else:
-                current_line.append(word)
-                current_length += word_length
-
-        if current_line:
-            lines.append(" ".join(current_line))
-
         indent_str = " " * indent
-        return "\n".join(indent_str + line for line in lines)
+        return "\n".join(textwrap.wrap(
+            text,
+            width=self.width,
+            initial_indent=indent_str,
+            subsequent_indent=indent_str,
+            break_long_words=False
+        ))
 
 
 class CLIInterface:
@@ -122,10 +124,58 @@ class CLIInterface:
         """
         self.width = width
         self.table = Table(width)
+        self._vt_enabled = self._enable_vt_mode()
+        self._buffer = None
+
+    @staticmethod
+    def _enable_vt_mode() -> bool:
+        """Enable ANSI escape processing (needed on legacy Windows consoles)"""
+        if os.name != 'nt':
+            return True
+        try:
+            # Known no-op that flips on ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            os.system('')
+            return True
+        except Exception:
+            return False
+
+    def _emit(self, text: str = ""):
+        """Print a line, or collect it when inside a buffered() block"""
+        if self._buffer is not None:
+            self._buffer.append(text)
+        else:
+            print(text)
+
+    @contextmanager
+    def buffered(self):
+        """
+        Collect display output and flush it as a single stdout write
+
+        Reduces per-line print/encode/lock overhead when rendering whole
+        screens (menus, spider lists).
+        """
+        self._buffer = []
+        try:
+            yield
+        finally:
+            parts = self._buffer
+            self._buffer = None
+            if parts:
+                sys.stdout.write("\n".join(parts) + "\n")
+                sys.stdout.flush()
+
+    def display_text(self, text: str = ""):
+        """Display a plain line of text (buffer-aware)"""
+        self._emit(text)
 
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self._vt_enabled:
+            # Direct ANSI write avoids forking a shell per redraw
+            sys.stdout.write(_CLEAR)
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
 
     def pause(self, message: str = "Press Enter to continue..."):
         """Pause and wait for user input"""
@@ -158,15 +208,15 @@ class CLIInterface:
 
     def display_header(self, title: str):
         """Display application header"""
-        print("\n" + self.table.header(title))
+        self._emit("\n" + self.table.header(title))
 
     def display_section(self, title: str):
         """Display a section title"""
-        print("\n" + self.table.section_title(title))
+        self._emit("\n" + self.table.section_title(title))
 
     def display_info(self, key: str, value: str, key_width: int = 30):
         """Display key-value information"""
-        print(self.table.key_value(key, value, key_width))
+        self._emit(self.table.key_value(key, value, key_width))
 
     def display_menu_options(self, options: List[tuple]):
         """
@@ -175,39 +225,39 @@ class CLIInterface:
         Args:
             options: List of tuples (number, text, description)
         """
-        print()
+        self._emit()
         for opt in options:
             if len(opt) == 2:
                 number, text = opt
-                print(self.table.numbered_item(number, text))
+                self._emit(self.table.numbered_item(number, text))
             else:
                 number, text, description = opt
-                print(self.table.numbered_item(number, text, description))
+                self._emit(self.table.numbered_item(number, text, description))
 
     def display_table_header(self, *headers):
         """Display table column headers"""
-        print(self.table.row(*headers, align="left"))
-        print(self.table.separator("-"))
+        self._emit(self.table.row(*headers, align="left"))
+        self._emit(self.table.separator("-"))
 
     def display_table_row(self, *columns):
         """Display a table row"""
-        print(self.table.row(*columns, align="left"))
+        self._emit(self.table.row(*columns, align="left"))
 
     def display_error(self, message: str):
         """Display an error message"""
-        print(f"\n✗ ERROR: {message}")
+        self._emit(f"\n✗ ERROR: {message}")
 
     def display_success(self, message: str):
         """Display a success message"""
-        print(f"\n✓ SUCCESS: {message}")
+        self._emit(f"\n✓ SUCCESS: {message}")
 
     def display_warning(self, message: str):
         """Display a warning message"""
-        print(f"\n⚠ WARNING: {message}")
+        self._emit(f"\n⚠ WARNING: {message}")
 
     def display_separator(self, char: str = "-"):
         """Display a separator line"""
-        print(self.table.separator(char))
+        self._emit(self.table.separator(char))
 
 
 class SpiderMenuInterface:
@@ -222,7 +272,7 @@ class SpiderMenuInterface:
         """
         self.cli = cli
 
-    def display_main_menu(self, spiders: List[Dict], extra_options: List[tuple] = None):
+    def display_main_menu(self, spiders: List, extra_options: List[tuple] = None):
         """
         Display main spider selection menu
 
@@ -231,47 +281,43 @@ class SpiderMenuInterface:
             extra_options: Additional menu options [(number, text), ...]
         """
         self.cli.clear_screen()
-        self.cli.display_header("LLM METADATA SCRAPER")
 
-        if not spiders:
-            self.cli.display_error("No spiders detected!")
-            return
+        with self.cli.buffered():
+            self.cli.display_header("LLM METADATA SCRAPER")
 
-        self.cli.display_section("Available Spiders")
+            if not spiders:
+                self.cli.display_error("No spiders detected!")
+                return
 
-        # Display spiders in a table format
-        options = []
-        for i, spider in enumerate(spiders, 1):
-            name = spider['name']
-            desc = spider.get('description', 'No description')
-            # Truncate description if too long
-            if len(desc) > 50:
-                desc = desc[:47] + "..."
-            options.append((i, name, desc))
+            self.cli.display_section("Available Spiders")
 
-        self.cli.display_menu_options(options)
+            # Display spiders in a table format (descriptions pre-truncated)
+            options = [(i, spider.name, spider.short_description)
+                       for i, spider in enumerate(spiders, 1)]
 
-        # Display extra options
-        if extra_options:
-            print()
-            self.cli.display_separator()
-            self.cli.display_menu_options(extra_options)
+            self.cli.display_menu_options(options)
 
-        self.cli.display_separator()
+            # Display extra options
+            if extra_options:
+                self.cli.display_text()
+                self.cli.display_separator()
+                self.cli.display_menu_options(extra_options)
+
+            self.cli.display_separator()
 
-    def display_spider_details(self, spider: Dict):
+    def display_spider_details(self, spider):
         """Display detailed information about a spider"""
         self.cli.clear_screen()
-        self.cli.display_header(f"SPIDER: {spider['name'].upper()}")
+        self.cli.display_header(f"SPIDER: {spider.name.upper()}")
 
         print()
-        self.cli.display_info("Name", spider['name'])
-        self.cli.display_info("Description", spider.get('description', 'N/A'))
-        self.cli.display_info("Module", spider.get('module', 'N/A'))
+        self.cli.display_info("Name", spider.name)
+        self.cli.display_info("Description", spider.description or 'N/A')
+        self.cli.display_info("Module", spider.module or 'N/A')
 
-        if spider.get('parameters'):
+        if spider.parameters:
             self.cli.display_section("Parameters")
-            for param_name, param_type, default in spider['parameters']:
+            for param_name, param_type, default in spider.parameters:
                 default_str = f"(default: {default})" if default != "None" else "(required)"
                 self.cli.display_info(f"  {param_name} ({param_type})", default_str, key_width=40)
 
@@ -281,7 +327,7 @@ class SpiderMenuInterface:
         prompt = f"Select option (0 to exit, 1-{max_choice})"
         return self.cli.get_input(prompt)
 
-    def get_spider_parameters(self, spider: Dict) -> Dict:
+    def get_spider_parameters(self, spider) -> Dict:
         """
         Get parameters for running a spider
 
@@ -293,13 +339,13 @@ class SpiderMenuInterface:
         """
         params = {}
 
-        if not spider.get('parameters'):
+        if not spider.parameters:
             return params
 
         self.cli.display_section("Spider Parameters")
         print("Press Enter to use default values\n")
 
-        for param_name, param_type, default in spider['parameters']:
+        for param_name, param_type, default in spider.parameters:
             default_display = default if default != "None" else ""
             value = self.cli.get_input(f"{param_name} ({param_type})", default_display)
 
@@ -3,14 +3,56 @@ Downloads extraction functions
 """
 
 import logging
+import re
 from typing import Dict
 from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
 from selenium.webdriver.common.by import By
 from lxml import html as lxml_html
-from my_scraper.utils import is_numeric_value
+from my_scraper.utils import is_numeric_value, compile_css, classify_selectors, xpath_texts
+from my_scraper.extractors.selenium_utils import get_element_texts
 
 logger = logging.getLogger(__name__)
 
+# Number with optional decimal/thousands part, captured apart from its
+# optional K/M/B suffix so one findall yields (value, suffix) pairs
+_NUM_RE = re.compile(r'(\d[\d,\.]*)\s*([KMB])?', re.IGNORECASE)
+
+# Abbreviated count suffix (K/M/B, either case)
+_SUFFIX_RE = re.compile(r'[KMB]', re.IGNORECASE)
+
+# Cap on span candidates collected by the last-resort fallback
+_MAX_FALLBACK_CANDIDATES = 50
+
+
+def _pick_best(candidates: list) -> str:
+    """
+    Pick the most likely download count from fallback candidates
+
+    Prefers the first value with a K/M/B suffix, else the largest plain
+    number, in a single pass.
+
+    Args:
+        candidates: Candidate count strings
+
+    Returns:
+        Best candidate string
+    """
+    best = ''
+    best_val = -1
+    for candidate in candidates:
+        if _SUFFIX_RE.search(candidate):
+            logger.info(f"Using first value with suffix: {candidate}")
+            return candidate
+        digits = ''.join(c for c in candidate if c.isdigit())
+        val = int(digits) if digits else 0
+        if val > best_val:
+            best = candidate
+            best_val = val
+
+    logger.info(f"Using largest number: {best}")
+    return best
+
 
 def extract_downloads(driver: webdriver.Chrome, tree: lxml_html.HtmlElement,
                      selectors: Dict, name: str) -> str:
@@ -30,67 +72,70 @@ def extract_downloads(driver: webdriver.Chrome, tree: lxml_html.HtmlElement,
 
     # If no driver, can't extract downloads (requires JavaScript rendering)
     if not driver:
-        logger.debug(f"No driver provided, skipping downloads extraction for {name}")
+        logger.debug("No driver provided, skipping downloads extraction for %s", name)
         return downloads
 
+    # Classify each selector as CSS vs XPath once, outside the loops
+    classified = classify_selectors(selectors.get('downloads', []))
+
     # Try CSS selectors via Selenium for dynamic content
     # IMPORTANT: Use the FIRST valid match from prioritized selectors
     # Don't collect all candidates - trust the selector priority order
-    for selector in selectors.get('downloads', []):
-        # Check if it's a CSS selector (starts with . or #)
-        if selector.startswith('.') or selector.startswith('#') or selector.startswith('span') or selector.startswith('div'):
+    for is_css, selector in classified:
+        if is_css:
             try:
-                logger.debug(f"Trying downloads CSS selector via Selenium: {selector}")
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                logger.debug(f"Found {len(elements)} elements with CSS selector")
+                logger.debug("Trying downloads CSS selector: %s", selector)
+                try:
+                    texts = [elem.text_content().strip()
+                             for elem in compile_css(selector)(tree)]
+                except Exception as e:
+                    logger.debug("lxml CSS evaluation failed for %s: %s", selector, e)
+                    texts = []
+                if not texts:
+                    texts = get_element_texts(driver, selector)
+                logger.debug("Found %s elements with CSS selector", len(texts))
+
+                for text in texts:
+                    logger.debug("Checking element text: '%s'", text)
+                    if text and is_numeric_value(text):
+                        # Filter out engagement values (small decimals < 1 without K/M/B suffix)
+                        try:
+                            # Check if it's a small decimal that looks like engagement ratio
+                            if '.' in text and not _SUFFIX_RE.search(text):
+                                val = float(text.replace(',', ''))
+                                if val < 1:
+                                    logger.debug("Skipping engagement-like value: %s", text)
+                                    continue
+                        except (ValueError, TypeError):
+                            pass  # If conversion fails, keep it as candidate
 
-                for elem in elements:
-                    try:
-                        text = elem.text.strip()
-                        logger.debug(f"Checking element text: '{text}'")
-                        if text and is_numeric_value(text):
-                            # Filter out engagement values (small decimals < 1 without K/M/B suffix)
-                            try:
-                                # Check if it's a small decimal that looks like engagement ratio
-                                if '.' in text and not any(x in text.upper() for x in ['K', 'M', 'B']):
-                                    val = float(text.replace(',', ''))
-                                    if val < 1:
-                                        logger.debug(f"Skipping engagement-like value: {text}")
-                                        continue
-                            except (ValueError, TypeError):
-                                pass  # If conversion fails, keep it as candidate
-
-                            # Found a valid value - return it immediately
-                            logger.info(f"Found downloads using selector '{selector}': {text}")
-                            return text
-                    except Exception as e:
-                        logger.debug(f"Error getting text from element: {e}")
-                        continue
+                        # Found a valid value - return it immediately
+                        logger.info(f"Found downloads using selector '{selector}': {text}")
+                        return text
             except Exception as e:
-                logger.debug(f"Downloads CSS selector {selector} failed: {e}")
+                logger.debug("Downloads CSS selector %s failed: %s", selector, e)
 
     # Try XPath selectors using lxml tree as fallback
-    for selector in selectors.get('downloads', []):
+    for is_css, selector in classified:
         # Skip CSS selectors (already tried above)
-        if selector.startswith('.') or selector.startswith('#') or selector.startswith('span') or selector.startswith('div'):
+        if is_css:
             continue
 
         try:
-            logger.debug(f"Trying downloads XPath selector: {selector}")
-            download_elements = tree.xpath(selector)
-            logger.debug(f"Found {len(download_elements)} elements with XPath")
-
-            if download_elements:
-                for elem in download_elements:
-                    text = elem.text_content().strip()
-                    logger.debug(f"Checking element text: '{text}'")
+            logger.debug("Trying downloads XPath selector: %s", selector)
+            texts = xpath_texts(tree, selector)
+            logger.debug("Found %s texts with XPath", len(texts))
+
+            if texts:
+                for text in texts:
+                    logger.debug("Checking element text: '%s'", text)
                     if text and is_numeric_value(text):
                         # Filter out engagement values (small decimals < 1 without K/M/B suffix)
                         try:
-                            if '.' in text and not any(x in text.upper() for x in ['K', 'M', 'B']):
+                            if '.' in text and not _SUFFIX_RE.search(text):
                                 val = float(text.replace(',', ''))
                                 if val < 1:
-                                    logger.debug(f"Skipping engagement-like value: {text}")
+                                    logger.debug("Skipping engagement-like value: %s", text)
                                     continue
                         except (ValueError, TypeError):
                             pass  # If conversion fails, keep it as candidate
@@ -99,20 +144,20 @@ def extract_downloads(driver: webdriver.Chrome, tree: lxml_html.HtmlElement,
                         logger.info(f"Found downloads using XPath '{selector}': {text}")
                         return text
         except Exception as e:
-            logger.debug(f"Downloads XPath selector {selector} failed: {e}")
+            logger.debug("Downloads XPath selector %s failed: %s", selector, e)
             continue
 
     # Fallback: Search for numeric values near "DOWNLOADS" heading
     if not downloads:
-        logger.debug(f"Trying fallback: searching for downloads near 'DOWNLOADS' heading")
-        all_candidates = []
+        logger.debug("Trying fallback: searching for downloads near 'DOWNLOADS' heading")
         try:
             # Strategy 1: Find the DOWNLOADS heading and look for siblings/nearby elements
             downloads_heading = driver.find_elements(By.XPATH, "//*[contains(text(), 'DOWNLOADS') or contains(text(), 'Downloads')]")
 
             if downloads_heading:
-                logger.debug(f"Found {len(downloads_heading)} 'DOWNLOADS' headings")
+                logger.debug("Found %s 'DOWNLOADS' headings", len(downloads_heading))
 
+                candidates = []
                 # Look for parent container and find numeric value within it
                 for heading in downloads_heading[:2]:
                     try:
@@ -120,55 +165,47 @@ def extract_downloads(driver: webdriver.Chrome, tree: lxml_html.HtmlElement,
                         parent = heading.find_element(By.XPATH, './ancestor::div[1]')
                         # Look for all text in the parent
                         text = parent.text
-                        # Extract numbers from the text
-                        import re
-                        numbers = re.findall(r'\d+(?:[,.]\d+)?[KMB]?', text)
-                        for num in numbers:
-                            if is_numeric_value(num):
-                                all_candidates.append(num)
-                                logger.debug(f"Found candidate near DOWNLOADS heading: {num}")
-                    except Exception:
+                        # Extract (number, suffix) pairs in one regex pass
+                        for num, suffix in _NUM_RE.findall(text):
+                            candidate = f"{num}{suffix}" if suffix else num
+                            if is_numeric_value(candidate):
+                                candidates.append(candidate)
+                                logger.debug("Found candidate near DOWNLOADS heading: %s", candidate)
+                    except (NoSuchElementException, StaleElementReferenceException):
                         continue
 
-            # Strategy 2: Look for all spans with numeric values
-            if not all_candidates:
-                all_spans = driver.find_elements(By.TAG_NAME, 'span')
-
-                for span in all_spans:
+                # Heading strategy succeeded - don't fall through to the page scan
+                if candidates:
+                    logger.info(f"Found {len(candidates)} download candidates near heading: {candidates[:10]}")
+                    return _pick_best(candidates)
+
+            # Strategy 2 (last resort): scan spans, but pre-filter to numeric
+            # text in the browser and cap the result - one JS round trip
+            span_texts = driver.execute_script(
+                "return Array.from(document.querySelectorAll('span'))"
+                ".map(e => e.innerText.trim())"
+                ".filter(t => /\\d/.test(t))"
+                ".slice(0, arguments[0]);",
+                _MAX_FALLBACK_CANDIDATES
+            ) or []
+
+            candidates = []
+            for text in span_texts:
+                if text and is_numeric_value(text):
+                    # Skip very small decimals (engagement ratios)
                     try:
-                        text = span.text.strip()
-                        if text and is_numeric_value(text):
-                            # Skip very small decimals (engagement ratios)
-                            try:
-                                if '.' in text and not any(x in text.upper() for x in ['K', 'M', 'B']):
-                                    val = float(text.replace(',', ''))
-                                    if val < 1:
-                                        continue
-                            except (ValueError, TypeError):
-                                pass
-
-                            all_candidates.append(text)
-                    except:
-                        continue
-
-            if all_candidates:
-                logger.info(f"Found {len(all_candidates)} download candidates: {all_candidates[:10]}")
-
-                # Prefer values with K/M/B suffix, then largest plain number
-                with_suffix = [c for c in all_candidates if any(x in c.upper() for x in ['K', 'M', 'B'])]
-                if with_suffix:
-                    downloads = with_suffix[0]
-                    logger.info(f"Using first value with suffix: {downloads}")
-                elif all_candidates:
-                    # Find largest number (likely to be total downloads)
-                    def to_int(val):
-                        try:
-                            digits = ''.join(c for c in val if c.isdigit())
-                            return int(digits) if digits else 0
-                        except:
-                            return 0
-                    downloads = max(all_candidates, key=to_int)
-                    logger.info(f"Using largest number: {downloads}")
+                        if '.' in text and not _SUFFIX_RE.search(text):
+                            val = float(text.replace(',', ''))
+                            if val < 1:
+                                continue
+                    except (ValueError, TypeError):
+                        pass
+
+                    candidates.append(text)
+
+            if candidates:
+                logger.info(f"Found {len(candidates)} download candidates: {candidates[:10]}")
+                downloads = _pick_best(candidates)
 
         except Exception as e:
             logger.error(f"Fallback download search failed: {e}")
@@ -5,18 +5,41 @@ Extracts model links from Kaggle listing pages
 
 import logging
 from typing import Dict, Set, Tuple, Optional
+from lxml import etree
 from lxml import html as lxml_html
 from my_scraper.utils import extract_model_name_from_url, build_full_url
 
 logger = logging.getLogger(__name__)
 
+# Compiled XPath objects keyed by expression - lxml re-tokenizes raw
+# string expressions on every call otherwise
+_XPATH_CACHE = {}
+
+
+def _get_xpath(expression: str) -> etree.XPath:
+    """
+    Get a compiled XPath object for an expression, compiling once
+
+    Args:
+        expression: XPath expression string
+
+    Returns:
+        Compiled etree.XPath callable
+    """
+    xp = _XPATH_CACHE.get(expression)
+    if xp is None:
+        xp = etree.XPath(expression)
+        _XPATH_CACHE[expression] = xp
+    return xp
+
 
 def extract_model_links(
     tree: lxml_html.HtmlElement,
     selectors: Dict,
     seen_urls: Set[str],
     page_num: int,
-    base_url: str = 'https://www.kaggle.com'
+    base_url: str = 'https://www.kaggle.com',
+    previous_first_url: Optional[str] = None
 ) -> Tuple[list, int, Optional[str]]:
     """
     Extract model links from a Kaggle listing page
@@ -27,6 +50,9 @@ def extract_model_links(
         seen_urls: Set of already seen URLs to avoid duplicates
         page_num: Current page number for logging
         base_url: Base URL for building full URLs
+        previous_first_url: First model URL from the previous page; when
+            the page still starts with it the content has not changed and
+            the walk is skipped entirely
 
     Returns:
         Tuple of (list of items, new_models_count, first_model_url)
@@ -37,46 +63,85 @@ def extract_model_links(
     first_model_url = None
     duplicate_count = 0
 
-    # Extract model links using configured selector
-    model_links_xpath = selectors.get('model_links_xpath')
-    list_items = tree.xpath(model_links_xpath)
+    # Strip the trailing slash once so the per-link fast path below can
+    # concatenate without re-normalizing
+    base = base_url.rstrip('/')
+
+    # Extract model links using configured selector (compiled once)
+    links_expr = selectors.get('model_links_xpath')
+    name_expr = selectors.get('model_name_xpath')
+    links_xp = _get_xpath(links_expr)
+    name_xp = _get_xpath(name_expr)
+    list_items = links_xp(tree)
 
     logger.info(f'Page {page_num}: Found {len(list_items)} model links')
 
+    # Content-change sentinel: if the page still leads with the previous
+    # first model, nothing new is here - skip the whole walk
+    if previous_first_url and list_items:
+        lead_href = list_items[0].get('href', '')
+        if lead_href:
+            if lead_href.startswith('/'):
+                lead_url = base + lead_href
+            else:
+                lead_url = build_full_url(base, lead_href)
+            if lead_url == previous_first_url:
+                logger.info(f'Page {page_num}: Content unchanged (same first model), skipping')
+                return [], 0, lead_url
+
+    # Batch all model names in one absolute evaluation; usable only when
+    # it aligns one name per link (i.e. every link has exactly one name
+    # node), otherwise fall back to the per-link relative lookup
+    names = None
+    if name_expr.startswith('.'):
+        batch_names = _get_xpath(links_expr + name_expr[1:])(tree)
+        if len(batch_names) == len(list_items):
+            names = [str(n).strip() for n in batch_names]
+
     # Extract data from each link
-    for link in list_items:
+    for idx, link in enumerate(list_items):
         href = link.get('href', '')
 
         if not href or href == '/models':
             continue
 
-        # Build full URL
-        full_url = build_full_url(base_url, href)
+        # Build full URL - inline the two common cases (site-relative and
+        # already-absolute hrefs) and only call build_full_url otherwise
+        if href.startswith('/'):
+            full_url = base + href
+        elif href.startswith('http'):
+            full_url = href
+        else:
+            full_url = build_full_url(base, href)
 
         # Track first model URL on this page for content change detection
         if first_model_url is None:
             first_model_url = full_url
 
-        # Skip if already seen
-        if full_url in seen_urls:
+        # Skip if already seen - add unconditionally and detect the
+        # duplicate from the length, hashing the URL only once
+        before = len(seen_urls)
+        seen_urls.add(full_url)
+        if len(seen_urls) == before:
             duplicate_count += 1
-            logger.debug(f'Page {page_num}: Duplicate URL: {full_url}')
+            logger.debug('Page %s: Duplicate URL: %s', page_num, full_url)
             continue
 
-        seen_urls.add(full_url)
         new_models_count += 1
 
-        # Extract model name
-        model_name_xpath = selectors.get('model_name_xpath')
-        name_elements = link.xpath(model_name_xpath)
-
-        if name_elements:
-            model_name = name_elements[0].strip()
+        # Extract model name (batched list when aligned, else per-link)
+        if names is not None:
+            model_name = names[idx]
         else:
-            # Fallback: extract from link text or URL
-            model_name = link.text_content().strip()
-            if not model_name:
-                model_name = extract_model_name_from_url(href)
+            name_elements = name_xp(link)
+
+            if name_elements:
+                model_name = name_elements[0].strip()
+            else:
+                # Fallback: extract from link text or URL
+                model_name = link.text_content().strip()
+                if not model_name:
+                    model_name = extract_model_name_from_url(href)
 
         if model_name:
             # Create item dict
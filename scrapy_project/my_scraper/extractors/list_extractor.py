@@ -0,0 +1,106 @@
+"""
+Shared list-style extraction helper for authors and collaborators
+"""
+
+import logging
+from typing import Callable, List, Optional, Pattern
+from selenium import webdriver
+from lxml import html as lxml_html
+from my_scraper.extractors.selenium_utils import (
+    expand_section,
+    get_element_texts,
+    refresh_tree,
+    wait_for_expanded,
+)
+from my_scraper.utils import compile_css, classify_selectors, xpath_texts
+
+logger = logging.getLogger(__name__)
+
+
+def extract_list_items(driver: webdriver.Chrome, tree: lxml_html.HtmlElement,
+                       selector_list: List[str], action_selector: Optional[str],
+                       filter_fn: Callable[[str], bool], kind: str,
+                       split_re: Optional[Pattern] = None) -> List[str]:
+    """
+    Extract a deduplicated list of text items using configured selectors
+
+    Handles the flow shared by the authors and collaborators extractors:
+    optional section expansion, CSS-via-lxml with Selenium fallback,
+    batched XPath text collection, splitting, filtering and dedup.
+
+    Args:
+        driver: Selenium driver instance
+        tree: lxml tree object
+        selector_list: Configured selectors (CSS or XPath)
+        action_selector: Optional expand-button CSS selector
+        filter_fn: Per-item validity predicate
+        kind: Item kind for logging (e.g. 'authors')
+        split_re: Optional compiled regex to split matched text into items
+
+    Returns:
+        List of extracted item strings
+    """
+    items = []
+    seen = set()  # O(1) dedup alongside the ordered result list
+
+    # No driver means no JavaScript rendering, so nothing to extract
+    if not driver:
+        logger.debug("No driver provided, skipping %s extraction", kind)
+        return []
+
+    try:
+        # Expand the section if configured (one JS round trip)
+        if action_selector:
+            result = expand_section(driver, action_selector)
+            logger.debug("%s action button %s: %s", kind, action_selector, result)
+            if result == 'clicked':
+                # Wait only until the DOM reports the expanded state
+                wait_for_expanded(driver, action_selector)
+                # Refresh tree after click (re-parses only if changed)
+                tree = refresh_tree(driver)
+
+        for is_css, selector in classify_selectors(selector_list):
+            try:
+                if is_css:
+                    # CSS selector - evaluate in-process against the parsed
+                    # tree first; only fall back to Selenium on zero matches
+                    logger.debug("Trying %s CSS selector: %s", kind, selector)
+                    try:
+                        texts = [elem.text_content().strip()
+                                 for elem in compile_css(selector)(tree)]
+                    except Exception as e:
+                        logger.debug("lxml CSS evaluation failed for %s: %s", selector, e)
+                        texts = []
+                    if not texts:
+                        texts = get_element_texts(driver, selector)
+                else:
+                    # XPath selector - collect all text nodes in one
+                    # libxml2 traversal
+                    logger.debug("Trying %s XPath selector: %s", kind, selector)
+                    texts = xpath_texts(tree, selector)
+                logger.debug("Found %s %s texts", len(texts), kind)
+
+                for text in texts:
+                    parts = split_re.split(text) if split_re else (text,)
+                    for part in parts:
+                        part = part.strip()
+                        if part and part not in seen:
+                            if filter_fn(part):
+                                seen.add(part)
+                                items.append(part)
+                                logger.debug("Found %s item: %s", kind, part)
+                            else:
+                                logger.debug("Skipping %s candidate: %s", kind, part[:50])
+
+                if items:
+                    logger.info(f"Found {len(items)} {kind} using selector: {selector}")
+                    break
+
+            except Exception as e:
+                logger.debug("%s selector %s failed: %s", kind, selector, e)
+                continue
+
+    except Exception as e:
+        logger.error(f"Error extracting {kind}: {e}")
+
+    return items
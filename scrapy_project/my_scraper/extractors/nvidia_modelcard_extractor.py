@@ -3,19 +3,40 @@ NVIDIA model card extraction functions
 """
 
 import logging
-import time
-import random
-import re
-from typing import Dict, Optional
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Union
 from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import StaleElementReferenceException
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from my_scraper.utils import compile_css
 
 logger = logging.getLogger(__name__)
 
+# One reused parser for model card parsing - no per-call parser
+# construction, no ID hash table
+_HTML_PARSER = lxml_html.HTMLParser(recover=True, collect_ids=False)
+
+# Alternative model card content selectors, tried in order after the
+# configured one
+_ALT_MODEL_CARD_SELECTORS = [
+    'div.prose.prose-markdown-compat.max-w-[85ch]',  # Full prose format
+    'div.prose',  # Generic prose
+    'div.prose-markdown-compat',  # Just markdown-compat
+]
+
+# Compiled once - nodes to drop from the model card markup
+_DROP_XPATH = etree.XPath('//svg | //button | //script | //style')
+
+# Text-bearing elements to walk in document order
+_CONTENT_TAGS = ('h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+                 'p', 'li', 'a', 'strong', 'em')
+
 
 def clean_model_card_html(html_content: str) -> str:
     """
@@ -31,38 +52,35 @@ def clean_model_card_html(html_content: str) -> str:
         return ''
 
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        doc = lxml_html.fromstring(html_content, parser=_HTML_PARSER)
 
         # Remove unwanted elements that don't contribute to content
-        # 1. Remove all SVG elements (icons, graphics)
-        for svg in soup.find_all('svg'):
-            svg.decompose()
-
-        # 2. Remove all button elements
-        for button in soup.find_all('button'):
-            button.decompose()
-
-        # 3. Remove script and style tags
-        for script in soup.find_all(['script', 'style']):
-            script.decompose()
+        # (SVG icons/graphics, buttons, script and style tags)
+        for node in _DROP_XPATH(doc):
+            parent = node.getparent()
+            if parent is not None:
+                parent.remove(node)
 
         # Get text content with some structure preservation
         text_lines = []
 
-        # Process each element to preserve some structure
-        for element in soup.find_all(['h1', 'h2', 'h3', 'h4', 'h5', 'h6', 'p', 'li', 'a', 'strong', 'em']):
-            text = element.get_text(strip=True)
+        # Process each element in document order to preserve some
+        # structure - iter() with tag filters walks the tree in C
+        # without materializing a match list
+        for element in doc.iter(*_CONTENT_TAGS):
+            text = element.text_content().strip()
             if not text:
                 continue
 
+            tag = element.tag
             # Add formatting for headings
-            if element.name in ['h1', 'h2']:
+            if tag in ('h1', 'h2'):
                 text_lines.append('\n' + text + '\n' + '=' * len(text))
-            elif element.name in ['h3', 'h4']:
+            elif tag in ('h3', 'h4'):
                 text_lines.append('\n' + text + '\n' + '-' * len(text))
-            elif element.name == 'li':
+            elif tag == 'li':
                 text_lines.append('• ' + text)
-            elif element.name == 'a' and element.get('href'):
+            elif tag == 'a' and element.get('href'):
                 # Include link URL in parentheses
                 href = element.get('href')
                 if href and href != text:
@@ -72,36 +90,212 @@ def clean_model_card_html(html_content: str) -> str:
             else:
                 text_lines.append(text)
 
-        # Join lines and clean up
-        cleaned_text = '\n'.join(text_lines)
-
-        # Remove excessive whitespace
-        cleaned_text = re.sub(r'\n\s*\n\s*\n+', '\n\n', cleaned_text)
-        cleaned_text = re.sub(r'  +', ' ', cleaned_text)
-
-        # Remove duplicate lines that may have been created
-        lines = cleaned_text.split('\n')
+        # Collapse whitespace, cap blank runs and drop duplicate lines in
+        # a single pass over the collected lines - no join/regex/re-split
+        # round trips over the full text
         unique_lines = []
         prev_line = None
-        for line in lines:
-            if line != prev_line or line.strip() in ['', '=' * len(line.strip()), '-' * len(line.strip())]:
+        blank_run = 0
+        for entry in text_lines:
+            for line in entry.split('\n'):
+                # Tighten runs of spaces inside the line
+                if '  ' in line:
+                    line = ' '.join(line.split())
+
+                stripped = line.strip()
+                if not stripped:
+                    # Keep at most one blank line in a row
+                    blank_run += 1
+                    if blank_run > 1:
+                        continue
+                else:
+                    blank_run = 0
+                    # Skip duplicates, but let heading underlines repeat
+                    if (line == prev_line and
+                            stripped != '=' * len(stripped) and
+                            stripped != '-' * len(stripped)):
+                        continue
+
                 unique_lines.append(line)
                 prev_line = line
 
-        cleaned_text = '\n'.join(unique_lines).strip()
-
-        return cleaned_text
+        return '\n'.join(unique_lines).strip()
 
     except Exception as e:
         logger.warning(f'Error cleaning HTML: {e}')
         # Fallback: just get text without formatting
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
-            return soup.get_text(separator='\n', strip=True)
-        except:
+            return lxml_html.fromstring(html_content).text_content().strip()
+        except Exception:
             return html_content
 
 
+def make_driver() -> webdriver.Chrome:
+    """
+    Create a Chrome driver tuned for text-only scraping
+
+    Model card and tag extraction only read DOM text, so images, webfonts
+    and stylesheets are blocked at the browser level and the page load
+    strategy is 'eager' (driver.get returns at DOMContentLoaded instead
+    of waiting for onload). Media-heavy model pages transfer less than
+    half the bytes this way.
+
+    Returns:
+        Configured headless Chrome driver
+    """
+    chrome_options = Options()
+    chrome_options.add_argument('--headless=new')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_experimental_option('prefs', {
+        'profile.managed_default_content_settings.images': 2,
+        'profile.managed_default_content_settings.stylesheets': 2,
+        'profile.managed_default_content_settings.fonts': 2,
+    })
+    chrome_options.page_load_strategy = 'eager'
+    return webdriver.Chrome(options=chrome_options)
+
+
+class DriverPool:
+    """
+    Pool of warm Chrome drivers for reuse across extraction calls
+
+    Driver cold-start costs one to two seconds; keeping a fixed set of
+    warm instances and checking them in and out amortizes that to zero
+    at steady state.
+    """
+
+    def __init__(self, size: int = 5, factory=None):
+        """
+        Initialize the pool
+
+        Args:
+            size: Number of driver instances to create up front
+            factory: Zero-argument callable returning a new driver
+                     (default: make_driver)
+        """
+        self.size = size
+        self._factory = factory or make_driver
+        self._pool = queue.Queue()
+        for _ in range(size):
+            self._pool.put(self._factory())
+
+    @classmethod
+    def from_drivers(cls, drivers):
+        """Wrap already-created driver instances in a pool"""
+        pool = cls.__new__(cls)
+        pool.size = len(drivers)
+        pool._factory = None
+        pool._pool = queue.Queue()
+        for driver in drivers:
+            pool._pool.put(driver)
+        return pool
+
+    @contextmanager
+    def acquire(self):
+        """Check a driver out of the pool, returning it on exit"""
+        driver = self._pool.get()
+        try:
+            yield driver
+        finally:
+            self._pool.put(driver)
+
+    def close(self):
+        """Quit every driver in the pool"""
+        while True:
+            try:
+                driver = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f'Error closing pooled driver: {e}')
+
+
+def extract_modelcards_batch(drivers: Union[List[webdriver.Chrome], DriverPool], urls: List[str],
+                             selectors: Dict, model_names: List[str],
+                             max_workers: int = 5) -> List[str]:
+    """
+    Extract model cards for several URLs concurrently over a driver pool
+
+    Model card extraction is wall-clock-bound on navigation and JS
+    rendering, so a bounded thread pool checking warm drivers out of a
+    queue hides most of the per-URL latency.
+
+    Args:
+        drivers: Warm Selenium driver instances (or a DriverPool) to share
+        urls: Model card page URLs, one per model
+        selectors: Selectors configuration dictionary
+        model_names: Model names for logging, aligned with urls
+        max_workers: Concurrency cap (also bounded by pool size)
+
+    Returns:
+        List of extracted model card texts, aligned with urls
+    """
+    pool = drivers if isinstance(drivers, DriverPool) else DriverPool.from_drivers(drivers)
+
+    def worker(url: str, model_name: str) -> str:
+        with pool.acquire() as driver:
+            try:
+                driver.get(url)
+                return extract_modelcard(driver, selectors, model_name)
+            except Exception as e:
+                logger.error(f'Error extracting model card for {model_name}: {e}')
+                return ''
+
+    workers = min(max_workers, pool.size) or 1
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(worker, urls, model_names))
+
+
+def extract_modelcard_from_html(html_source: str, selectors: Dict, model_name: str) -> str:
+    """
+    Extract model card content from already-fetched HTML, without a driver
+
+    First-pass static path: when the content is present in the captured
+    page source (as it is for server-rendered model card pages), the
+    whole extraction runs in lxml with zero WebDriver commands. Returns
+    an empty string when the content is not in the static HTML so the
+    caller can fall back to the Selenium path.
+
+    Args:
+        html_source: Page HTML (e.g. response.text from the middleware)
+        selectors: Selectors configuration dictionary
+        model_name: Model name for logging
+
+    Returns:
+        Extracted and cleaned model card text, or empty string
+    """
+    if not html_source:
+        return ''
+
+    try:
+        tree = lxml_html.fromstring(html_source, parser=_HTML_PARSER)
+    except Exception as e:
+        logger.debug(f'Could not parse static HTML for {model_name}: {e}')
+        return ''
+
+    model_card_selector = selectors.get('model_card_content', 'div.prose.prose-markdown-compat')
+
+    for sel in [model_card_selector] + _ALT_MODEL_CARD_SELECTORS:
+        try:
+            matches = compile_css(sel)(tree)
+        except Exception:
+            # Selector not expressible in cssselect - skip it here
+            continue
+        if matches:
+            fragment = lxml_html.tostring(matches[0], encoding='unicode')
+            cleaned = clean_model_card_html(fragment)
+            if cleaned:
+                logger.info(f"✓ Extracted model card for {model_name} from static HTML "
+                            f"({len(fragment)} chars -> {len(cleaned)} chars after cleaning)")
+                return cleaned
+
+    logger.debug(f'Model card not found in static HTML for {model_name}')
+    return ''
+
+
 def extract_modelcard(driver: webdriver.Chrome, selectors: Dict, model_name: str) -> str:
     """
     Extract NVIDIA model card content from the current page
@@ -119,66 +313,80 @@ def extract_modelcard(driver: webdriver.Chrome, selectors: Dict, model_name: str
         return ''
 
     try:
-        # Add extra wait time for content to fully load with randomization
-        # Reduced wait time for better throughput
-        wait_time = random.uniform(1.0, 1.5)
-        logger.debug(f"Waiting {wait_time:.2f}s for model card to load")
-        time.sleep(wait_time)  # Give more time for heavy content to load
+        # Wait for the document to finish loading instead of sleeping a
+        # fixed interval - returns as soon as the page is ready
+        try:
+            WebDriverWait(driver, 5).until(
+                lambda d: d.execute_script('return document.readyState') == 'complete'
+            )
+        except Exception:
+            logger.debug(f"Timed out waiting for document ready state for {model_name}")
 
         # Get model card content selector
         model_card_selector = selectors.get('model_card_content', 'div.prose.prose-markdown-compat')
 
-        # Alternative selectors to try
-        alternative_selectors = [
-            'div.prose.prose-markdown-compat.max-w-[85ch]',  # Full prose format
-            'div.prose',  # Generic prose
-            'div.prose-markdown-compat',  # Just markdown-compat
-        ]
-
         model_card_element = None
         used_selector = None
 
         # Try to find the model card content div with multiple selectors
         try:
-            # First try the primary selector (reduced timeout from 10 to 5)
+            # Probe the static HTML in-process first: one page_source grab
+            # and cached compiled selectors instead of WebDriverWait
+            # polling plus a find_element round trip per alternative
             try:
-                model_card_element = WebDriverWait(driver, 5).until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, model_card_selector))
-                )
-                used_selector = model_card_selector
-                logger.debug(f"Found model card with primary selector for {model_name}")
-            except:
-                # Try alternative selectors
-                for alt_selector in alternative_selectors:
+                tree = lxml_html.fromstring(driver.page_source, parser=_HTML_PARSER)
+                for sel in [model_card_selector] + _ALT_MODEL_CARD_SELECTORS:
                     try:
-                        model_card_element = driver.find_element(By.CSS_SELECTOR, alt_selector)
-                        used_selector = alt_selector
-                        logger.debug(f"Found model card with alternative selector '{alt_selector}' for {model_name}")
-                        break
-                    except:
+                        if compile_css(sel)(tree):
+                            used_selector = sel
+                            logger.debug(f"Found model card via lxml with selector '{sel}' for {model_name}")
+                            break
+                    except Exception:
+                        # Selector not expressible in cssselect (e.g.
+                        # bracketed Tailwind classes) - skip it here
                         continue
+            except Exception as e:
+                logger.debug(f"lxml model card probe failed: {e}")
+
+            if used_selector is None:
+                # Content not in the static HTML yet - fall back to the
+                # Selenium waits (reduced timeout from 10 to 5)
+                try:
+                    model_card_element = WebDriverWait(driver, 5).until(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, model_card_selector))
+                    )
+                    used_selector = model_card_selector
+                    logger.debug(f"Found model card with primary selector for {model_name}")
+                except:
+                    # Try alternative selectors
+                    for alt_selector in _ALT_MODEL_CARD_SELECTORS:
+                        try:
+                            model_card_element = driver.find_element(By.CSS_SELECTOR, alt_selector)
+                            used_selector = alt_selector
+                            logger.debug(f"Found model card with alternative selector '{alt_selector}' for {model_name}")
+                            break
+                        except:
+                            continue
 
-            if model_card_element:
-                # Add a small delay to ensure content is fully rendered (reduced from 0.5)
-                time.sleep(0.2)
-
-                # Extract the HTML content or text content
-                # Using outerHTML to preserve the full structure including div
+            if used_selector:
+                # Extract the outerHTML with the UI noise (svg/button/
+                # script/style) already stripped in-browser - one JS round
+                # trip, smaller payload, and no stale-element retries since
+                # the script re-queries by selector
                 model_card_html = None
 
-                for attempt in range(3):
-                    try:
-                        model_card_html = model_card_element.get_attribute('outerHTML')
-                        break
-                    except StaleElementReferenceException:
-                        logger.debug(f'Stale element getting model card HTML, retrying (attempt {attempt + 1})')
-                        time.sleep(0.5)
-                        # Re-find the element
-                        try:
-                            if used_selector:
-                                model_card_element = driver.find_element(By.CSS_SELECTOR, used_selector)
-                        except:
-                            break
+                try:
+                    model_card_html = driver.execute_script(
+                        "const el = document.querySelector(arguments[0]);"
+                        "if (!el) return '';"
+                        "const c = el.cloneNode(true);"
+                        "c.querySelectorAll('svg,button,script,style')"
+                        ".forEach(n => n.remove());"
+                        "return c.outerHTML;",
+                        used_selector
+                    )
+                except Exception as e:
+                    logger.debug(f'In-browser model card extraction failed: {e}')
 
                 if model_card_html and model_card_html.strip():
                     # Clean the HTML to remove UI elements
@@ -186,20 +394,17 @@ def extract_modelcard(driver: webdriver.Chrome, selectors: Dict, model_name: str
                     logger.info(f"✓ Extracted model card for {model_name} ({len(model_card_html)} chars -> {len(cleaned_html)} chars after cleaning)")
                     return cleaned_html
                 else:
-                    # Fallback to text content if outerHTML is empty
+                    # Fallback to text content if outerHTML is empty -
+                    # querying by selector inside the page cannot go stale
                     model_card_text = None
-                    for attempt in range(3):
-                        try:
-                            model_card_text = model_card_element.text.strip()
-                            break
-                        except StaleElementReferenceException:
-                            logger.debug(f'Stale element getting model card text, retrying (attempt {attempt + 1})')
-                            time.sleep(0.5)
-                            try:
-                                if used_selector:
-                                    model_card_element = driver.find_element(By.CSS_SELECTOR, used_selector)
-                            except:
-                                break
+                    try:
+                        model_card_text = driver.execute_script(
+                            "const el = document.querySelector(arguments[0]);"
+                            "return el ? el.innerText.trim() : '';",
+                            used_selector
+                        )
+                    except Exception as e:
+                        logger.debug(f'In-browser model card text extraction failed: {e}')
 
                     if model_card_text:
                         logger.info(f"✓ Extracted model card text for {model_name} ({len(model_card_text)} chars)")
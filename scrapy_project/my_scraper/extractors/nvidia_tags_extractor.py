@@ -3,19 +3,8 @@ NVIDIA-specific tags extraction functions
 """
 
 import logging
-import time
 from typing import Dict, List, Set
 from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
-
-from .selenium_utils import (
-    scroll_element_into_view,
-    click_element_with_fallback,
-    get_element_text,
-)
 
 logger = logging.getLogger(__name__)
 
@@ -43,47 +32,38 @@ def extract_visible_tags(container_element, selectors: Dict, model_name: str) ->
             logger.warning(f"Missing selectors for visible tags extraction for {model_name}")
             return tags
 
-        # Find the visible tags container WITHIN this specific model card container
+        # Walk containers, buttons and links in one JS round trip instead
+        # of a Selenium command per container, button and link
         try:
-            containers = container_element.find_elements(By.CSS_SELECTOR, visible_container_selector)
-
-            if not containers:
-                logger.debug(f"No visible tags container found for {model_name}")
-                return tags
-
-            logger.debug(f"Found {len(containers)} visible tags containers for {model_name}")
-
-            # Process each container (there may be multiple per model card)
-            for container in containers:
-                try:
-                    # Find tag buttons within this container
-                    tag_buttons = container.find_elements(By.CSS_SELECTOR, tag_button_selector)
-
-                    for button in tag_buttons:
-                        try:
-                            # Find the link within the button
-                            link = button.find_element(By.CSS_SELECTOR, tag_link_selector)
-                            tag_text = get_element_text(link)
-
-                            if tag_text and tag_text.strip():
-                                tags.add(tag_text.strip())
-                                logger.debug(f"Found visible tag: {tag_text.strip()}")
-                        except NoSuchElementException:
-                            # Try to get text from button itself if no link found
-                            tag_text = get_element_text(button)
-                            if tag_text and tag_text.strip() and not tag_text.startswith('+'):
-                                tags.add(tag_text.strip())
-                                logger.debug(f"Found visible tag (from button): {tag_text.strip()}")
-                        except Exception as e:
-                            logger.debug(f"Error extracting tag from button: {e}")
-                            continue
-
-                except Exception as e:
-                    logger.debug(f"Error processing tags container: {e}")
-                    continue
+            driver = container_element.parent
+            texts = driver.execute_script(
+                "const root = arguments[0];"
+                "const out = [];"
+                "root.querySelectorAll(arguments[1]).forEach(c => {"
+                "  c.querySelectorAll(arguments[2]).forEach(b => {"
+                "    const l = b.querySelector(arguments[3]);"
+                "    if (l) {"
+                "      const t = (l.innerText || '').trim();"
+                "      if (t) out.push(t);"
+                "    } else {"
+                "      const t = (b.innerText || '').trim();"
+                "      if (t && !t.startsWith('+')) out.push(t);"
+                "    }"
+                "  });"
+                "});"
+                "return out;",
+                container_element,
+                visible_container_selector,
+                tag_button_selector,
+                tag_link_selector
+            ) or []
+
+            tags.update(texts)
+            for tag_text in texts:
+                logger.debug("Found visible tag: %s", tag_text)
 
         except Exception as e:
-            logger.debug(f"Error finding visible tags container: {e}")
+            logger.debug(f"Error extracting visible tags: {e}")
 
     except Exception as e:
         logger.error(f"Error in extract_visible_tags for {model_name}: {e}")
@@ -122,103 +102,75 @@ def extract_popover_tags(container_element, driver: webdriver.Chrome, selectors:
             logger.debug(f"Missing selectors for popover tags extraction for {model_name}")
             return tags
 
-        # Find "+N" more button WITHIN this specific model card container
+        # Open, read and close every "+N" popover inside the browser in
+        # one async script: synthetic clicks, a MutationObserver to catch
+        # the popover appearing, and a timeout guard per button. Replaces
+        # the scroll/click/sleep/read/close Selenium sequence (~1s of
+        # fixed sleeps per popover).
         try:
-            more_buttons = container_element.find_elements(By.CSS_SELECTOR, more_button_selector)
-
-            if not more_buttons:
-                logger.debug(f"No '+N' more tags buttons found for {model_name}")
-                return tags
-
-            logger.debug(f"Found {len(more_buttons)} '+N' buttons for {model_name}")
-
-            # Click each button and extract tags from the popover
-            for idx, button in enumerate(more_buttons):
-                try:
-                    button_text = get_element_text(button)
-                    logger.debug(f"Clicking '+N' button {idx + 1}/{len(more_buttons)}: {button_text}")
-
-                    # Scroll button into view
-                    scroll_element_into_view(driver, button)
-                    time.sleep(0.3)
-
-                    # Click the button to open popover
-                    if not click_element_with_fallback(driver, button):
-                        logger.debug(f"Failed to click '+N' button {idx + 1}")
-                        continue
-
-                    # Wait for popover to appear
-                    time.sleep(0.5)
-
-                    # Try to find the popover container
-                    popover = None
-                    try:
-                        if popover_container_selector:
-                            wait = WebDriverWait(driver, 2)
-                            popover = wait.until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, popover_container_selector))
-                            )
-                    except TimeoutException:
-                        # Try alternative selector
-                        if popover_container_alt_selector:
-                            try:
-                                popover = driver.find_element(By.CSS_SELECTOR, popover_container_alt_selector)
-                            except NoSuchElementException:
-                                logger.debug(f"Popover not found with alternative selector")
-
-                    if not popover:
-                        logger.debug(f"Popover did not appear for button {idx + 1}")
-                        # Try to close any open popover
-                        try:
-                            driver.find_element(By.TAG_NAME, 'body').click()
-                        except:
-                            pass
-                        continue
-
-                    # Extract tags from popover
-                    try:
-                        tag_buttons = popover.find_elements(By.CSS_SELECTOR, popover_tag_button_selector)
-                        logger.debug(f"Found {len(tag_buttons)} tags in popover")
-
-                        for tag_button in tag_buttons:
-                            try:
-                                # Find the link within the button
-                                link = tag_button.find_element(By.CSS_SELECTOR, tag_link_selector)
-                                tag_text = get_element_text(link)
-
-                                if tag_text and tag_text.strip():
-                                    tags.add(tag_text.strip())
-                                    logger.debug(f"Found popover tag: {tag_text.strip()}")
-                            except NoSuchElementException:
-                                # Try to get text from button itself if no link found
-                                tag_text = get_element_text(tag_button)
-                                if tag_text and tag_text.strip():
-                                    tags.add(tag_text.strip())
-                                    logger.debug(f"Found popover tag (from button): {tag_text.strip()}")
-                            except Exception as e:
-                                logger.debug(f"Error extracting tag from popover button: {e}")
-                                continue
-                    except Exception as e:
-                        logger.debug(f"Error extracting tags from popover: {e}")
-
-                    # Close the popover by clicking outside or pressing Escape
-                    try:
-                        driver.find_element(By.TAG_NAME, 'body').click()
-                        time.sleep(0.3)
-                    except:
-                        pass
-
-                except Exception as e:
-                    logger.debug(f"Error processing '+N' button {idx + 1}: {e}")
-                    # Try to close any open popover
-                    try:
-                        driver.find_element(By.TAG_NAME, 'body').click()
-                    except:
-                        pass
-                    continue
+            driver.set_script_timeout(15)
+            texts = driver.execute_async_script(
+                "const done = arguments[arguments.length - 1];"
+                "const root = arguments[0];"
+                "const moreSel = arguments[1], popSel = arguments[2],"
+                "      popAltSel = arguments[3], btnSel = arguments[4],"
+                "      linkSel = arguments[5];"
+                "const buttons = Array.from(root.querySelectorAll(moreSel));"
+                "const out = [];"
+                "function readPopover(pop) {"
+                "  pop.querySelectorAll(btnSel).forEach(tb => {"
+                "    const l = tb.querySelector(linkSel);"
+                "    const t = ((l ? l.innerText : tb.innerText) || '').trim();"
+                "    if (t) out.push(t);"
+                "  });"
+                "}"
+                "function findPopover() {"
+                "  return document.querySelector(popSel) ||"
+                "         (popAltSel ? document.querySelector(popAltSel) : null);"
+                "}"
+                "function next(i) {"
+                "  if (i >= buttons.length) { done(out); return; }"
+                "  const b = buttons[i];"
+                "  b.scrollIntoView({block: 'center'});"
+                "  let finished = false;"
+                "  const obs = new MutationObserver(() => {"
+                "    const pop = findPopover();"
+                "    if (pop && !finished) {"
+                "      finished = true;"
+                "      obs.disconnect();"
+                "      readPopover(pop);"
+                "      document.body.click();"
+                "      requestAnimationFrame(() => next(i + 1));"
+                "    }"
+                "  });"
+                "  obs.observe(document.body, {childList: true, subtree: true});"
+                "  b.click();"
+                "  setTimeout(() => {"
+                "    if (!finished) {"
+                "      finished = true;"
+                "      obs.disconnect();"
+                "      const pop = findPopover();"
+                "      if (pop) readPopover(pop);"
+                "      document.body.click();"
+                "      next(i + 1);"
+                "    }"
+                "  }, 2000);"
+                "}"
+                "next(0);",
+                container_element,
+                more_button_selector,
+                popover_container_selector or '',
+                popover_container_alt_selector or '',
+                popover_tag_button_selector,
+                tag_link_selector
+            ) or []
+
+            tags.update(t for t in texts if t)
+            for tag_text in texts:
+                logger.debug("Found popover tag: %s", tag_text)
 
         except Exception as e:
-            logger.debug(f"Error finding '+N' buttons: {e}")
+            logger.debug(f"Error extracting popover tags: {e}")
 
     except Exception as e:
         logger.error(f"Error in extract_popover_tags for {model_name}: {e}")
@@ -257,16 +209,18 @@ def extract_nvidia_tags(container_element, driver: webdriver.Chrome, selectors:
         # Extract popover tags from the specific container
         popover_tags = extract_popover_tags(container_element, driver, selectors, model_name)
 
-        # Combine all tags
-        all_tags = visible_tags.union(popover_tags)
+        # Combine all tags in place - no third set, and sorted() takes
+        # the set directly
+        num_visible = len(visible_tags)
+        visible_tags |= popover_tags
 
-        if all_tags:
-            logger.info(f"Total extracted {len(all_tags)} unique tags for {model_name} "
-                       f"({len(visible_tags)} visible + {len(popover_tags)} from popover)")
+        if visible_tags:
+            logger.info(f"Total extracted {len(visible_tags)} unique tags for {model_name} "
+                       f"({num_visible} visible + {len(popover_tags)} from popover)")
         else:
             logger.warning(f"No tags found for {model_name}")
 
-        return sorted(list(all_tags))
+        return sorted(visible_tags)
 
     except Exception as e:
         logger.error(f"Error extracting NVIDIA tags for {model_name}: {e}")
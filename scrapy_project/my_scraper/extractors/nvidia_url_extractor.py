@@ -3,56 +3,165 @@ NVIDIA model URL and name extraction functions
 """
 
 import logging
-import time
-from typing import Dict, Optional, Tuple
+from typing import Dict, Optional
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.common.exceptions import StaleElementReferenceException
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.common.exceptions import (
+    StaleElementReferenceException,
+    TimeoutException,
+    WebDriverException,
+)
 
 logger = logging.getLogger(__name__)
 
+# How often WebDriverWait re-checks after a stale reference; responds
+# within ~50ms of the DOM stabilizing instead of a fixed 200-300ms sleep
+_STALE_POLL = 0.05
+_STALE_TIMEOUT = 1.0
+
+# Base for absolutizing relative model URLs; plain concat beats f-string
+# interpolation in the per-card loop
+_BASE = 'https://build.nvidia.com'
+
+
+def bulk_extract_cards(driver: webdriver.Chrome, card_selector: str,
+                       name_attr: str = 'title', url_attr: str = 'href') -> list:
+    """
+    Read name, URL and parent container for every card in one JS call
+
+    Each per-card attribute read costs a WebDriver round trip; for N
+    cards the old flow issued ~3N of them (name, URL, ancestor lookup).
+    One execute_script walks all cards inside the page and returns the
+    lot atomically, which also rules out stale references during the
+    read.
+
+    Args:
+        driver: Selenium driver instance
+        card_selector: CSS selector matching the model card anchors
+        name_attr: Attribute holding the model name
+        url_attr: Attribute holding the model URL
+
+    Returns:
+        List of dicts with 'name', 'url', 'parent' (the third ancestor
+        div as a WebElement, mirroring ./ancestor::div[3]) and 'idx'
+    """
+    try:
+        entries = driver.execute_script(
+            "return Array.from(document.querySelectorAll(arguments[0]))"
+            ".map((a, i) => {"
+            "  let p = a.parentElement, divs = 0;"
+            "  while (p && divs < 3) {"
+            "    if (p.tagName === 'DIV' && ++divs === 3) break;"
+            "    p = p.parentElement;"
+            "  }"
+            "  return {name: a.getAttribute(arguments[1]),"
+            "          url: a.getAttribute(arguments[2]),"
+            "          parent: p, idx: i};"
+            "});",
+            card_selector, name_attr, url_attr
+        ) or []
+    except Exception as e:
+        logger.error(f'Bulk card extraction failed: {e}')
+        return []
+
+    # Normalize relative URLs to the full build.nvidia.com form
+    for entry in entries:
+        url = entry.get('url')
+        if url and url[:4] != 'http':
+            entry['url'] = _BASE + url
+
+    return entries
+
+
+class _AttrOfCard:
+    """
+    Expected condition: re-find a model card and read one attribute
+
+    Used as the WebDriverWait predicate after a StaleElementReferenceException:
+    each poll re-finds the card fresh and reads the attribute in one shot,
+    so the wait returns as soon as the DOM has stabilized.
+    """
+
+    def __init__(self, card_selector: str, attribute: str, idx: Optional[int] = None):
+        self.card_selector = card_selector
+        self.attribute = attribute
+        self.idx = idx
+
+    def __call__(self, driver):
+        if self.idx is None:
+            card = driver.find_element(By.CSS_SELECTOR, self.card_selector)
+            value = card.get_attribute(self.attribute)
+        else:
+            # Read the indexed card's attribute in-page: one round trip,
+            # no serialization of all N card elements per poll
+            value = driver.execute_script(
+                "const cards = document.querySelectorAll(arguments[0]);"
+                "if (arguments[1] >= cards.length) return null;"
+                "return cards[arguments[1]].getAttribute(arguments[2]);",
+                self.card_selector, self.idx, self.attribute
+            )
+        return value if value else False
+
+
+def _wait_for_card_attribute(driver: webdriver.Chrome, card_selector: str,
+                             attribute: str, idx: Optional[int] = None) -> Optional[str]:
+    """
+    Poll for a card attribute after a stale reference
+
+    Args:
+        driver: Selenium WebDriver instance
+        card_selector: CSS selector to re-find the card(s)
+        attribute: Attribute name to extract
+        idx: Card index when the selector matches several cards
+
+    Returns:
+        Attribute value or None if it never became readable
+    """
+    try:
+        return WebDriverWait(
+            driver, _STALE_TIMEOUT, poll_frequency=_STALE_POLL,
+            ignored_exceptions=(StaleElementReferenceException,)
+        ).until(_AttrOfCard(card_selector, attribute, idx))
+    except TimeoutException:
+        logger.warning(f'Element remained stale after {_STALE_TIMEOUT}s')
+        return None
+    except WebDriverException as e:
+        logger.warning(f'Could not re-find element: {e}')
+        return None
+
 
 def safe_get_element_attribute(element, driver: webdriver.Chrome, card_selector: str,
-                               attribute: str, max_retries: int = 3) -> Optional[str]:
+                               attribute: str) -> Optional[str]:
     """
-    Safely get attribute from a potentially stale element with retry logic
+    Safely get attribute from a potentially stale element
+
+    Tries the element directly first; on a stale reference, falls back to
+    a short WebDriverWait that re-finds the element by selector.
 
     Args:
         element: WebElement that might be stale
         driver: Selenium WebDriver instance
         card_selector: CSS selector to re-find the element
         attribute: Attribute name to extract
-        max_retries: Maximum number of retries
 
     Returns:
         Attribute value or None if not found
     """
-    for attempt in range(max_retries):
-        try:
-            return element.get_attribute(attribute)
-        except StaleElementReferenceException:
-            if attempt < max_retries - 1:
-                logger.debug(f'Stale element on attempt {attempt + 1}, re-finding element...')
-                time.sleep(0.2)  # Brief pause before retry
-                try:
-                    # Re-find the element using the selector
-                    element = driver.find_element(By.CSS_SELECTOR, card_selector)
-                except Exception as e:
-                    logger.warning(f'Could not re-find element: {e}')
-                    return None
-            else:
-                logger.warning(f'Element remained stale after {max_retries} attempts')
-                raise
-        except Exception as e:
-            logger.debug(f'Error getting attribute: {e}')
-            return None
-    return None
+    try:
+        return element.get_attribute(attribute)
+    except StaleElementReferenceException:
+        logger.debug('Stale element, re-finding via wait...')
+        return _wait_for_card_attribute(driver, card_selector, attribute)
+    except WebDriverException as e:
+        logger.debug(f'Error getting attribute: {e}')
+        return None
 
 
 def extract_model_name_from_card(card, driver: webdriver.Chrome, selectors: Dict,
                                 card_selector: str, idx: int) -> Optional[str]:
     """
-    Extract model name from a model card element with retry logic
+    Extract model name from a model card element with stale-element recovery
 
     Args:
         card: WebElement representing the model card
@@ -65,25 +174,12 @@ def extract_model_name_from_card(card, driver: webdriver.Chrome, selectors: Dict
         Model name string or None if not found
     """
     model_name_attr = selectors.get('model_name_attr', 'title')
-    model_name = None
 
-    for attempt in range(3):
-        try:
-            model_name = card.get_attribute(model_name_attr)
-            break
-        except StaleElementReferenceException:
-            logger.debug(f'Stale element for card {idx + 1}, re-finding (attempt {attempt + 1})')
-            time.sleep(0.3)
-            try:
-                model_cards = driver.find_elements(By.CSS_SELECTOR, card_selector)
-                if idx < len(model_cards):
-                    card = model_cards[idx]
-                else:
-                    logger.warning(f'Card index {idx} out of range after re-finding')
-                    break
-            except Exception as e:
-                logger.warning(f'Error re-finding card: {e}')
-                break
+    try:
+        model_name = card.get_attribute(model_name_attr)
+    except StaleElementReferenceException:
+        logger.debug(f'Stale element for card {idx + 1}, re-finding via wait')
+        model_name = _wait_for_card_attribute(driver, card_selector, model_name_attr, idx)
 
     if not model_name:
         logger.warning(f'Model card {idx + 1} has no name attribute')
@@ -94,7 +190,7 @@ def extract_model_name_from_card(card, driver: webdriver.Chrome, selectors: Dict
 def extract_model_url_from_card(card, driver: webdriver.Chrome, selectors: Dict,
                                card_selector: str, idx: int, model_name: str) -> Optional[str]:
     """
-    Extract model URL from a model card element with retry logic
+    Extract model URL from a model card element with stale-element recovery
 
     Args:
         card: WebElement representing the model card
@@ -108,36 +204,19 @@ def extract_model_url_from_card(card, driver: webdriver.Chrome, selectors: Dict,
         Full model URL string or None if not found
     """
     model_url_attr = selectors.get('model_url_attr', 'href')
-    model_url = None
 
-    for attempt in range(3):
-        try:
-            model_url = card.get_attribute(model_url_attr)
-            break
-        except StaleElementReferenceException:
-            logger.debug(f'Stale element getting URL for {model_name}, re-finding (attempt {attempt + 1})')
-            time.sleep(0.3)
-            try:
-                model_cards = driver.find_elements(By.CSS_SELECTOR, card_selector)
-                if idx < len(model_cards):
-                    card = model_cards[idx]
-                else:
-                    logger.warning(f'Card index {idx} out of range after re-finding')
-                    break
-            except Exception as e:
-                logger.warning(f'Error re-finding card: {e}')
-                break
+    try:
+        model_url = card.get_attribute(model_url_attr)
+    except StaleElementReferenceException:
+        logger.debug(f'Stale element getting URL for {model_name}, re-finding via wait')
+        model_url = _wait_for_card_attribute(driver, card_selector, model_url_attr, idx)
 
     if not model_url:
         logger.warning(f'Model {model_name} has no URL attribute')
         return None
 
-    # Ensure we have the full URL
-    if not model_url.startswith('http'):
-        # If it's just a path, prepend the base URL
-        model_url = f'https://build.nvidia.com{model_url}'
-
-    return model_url
+    # Ensure we have the full URL; if it's just a path, prepend the base
+    return model_url if model_url[:4] == 'http' else _BASE + model_url
 
 
 def extract_parent_container(card, driver: webdriver.Chrome, idx: int,
@@ -160,23 +239,25 @@ def extract_parent_container(card, driver: webdriver.Chrome, idx: int,
     # Navigate to parent container that includes both the link and tags
     # The structure is typically: a[data-linkbox-overlay] is nested within several divs
     # that also contain the tags. We need to find the right ancestor.
-    for attempt in range(3):
+    def _find_parent(drv):
+        cards = drv.find_elements(By.CSS_SELECTOR, card_selector)
+        if idx >= len(cards):
+            return False
+        return cards[idx].find_element(By.XPATH, './ancestor::div[3]')
+
+    try:
+        parent_container = card.find_element(By.XPATH, './ancestor::div[3]')
+    except StaleElementReferenceException:
+        logger.debug(f'Stale element finding parent for {model_name}, re-finding via wait')
         try:
-            parent_container = card.find_element(By.XPATH, './ancestor::div[3]')
-            break
-        except StaleElementReferenceException:
-            logger.debug(f'Stale element finding parent for {model_name}, re-finding (attempt {attempt + 1})')
-            time.sleep(0.3)
-            try:
-                model_cards = driver.find_elements(By.CSS_SELECTOR, card_selector)
-                if idx < len(model_cards):
-                    card = model_cards[idx]
-                else:
-                    logger.warning(f'Card index {idx} out of range after re-finding')
-                    break
-            except Exception as e:
-                logger.warning(f'Error re-finding card: {e}')
-                break
+            parent_container = WebDriverWait(
+                driver, _STALE_TIMEOUT, poll_frequency=_STALE_POLL,
+                ignored_exceptions=(StaleElementReferenceException,)
+            ).until(_find_parent)
+        except TimeoutException:
+            logger.warning(f'Element remained stale after {_STALE_TIMEOUT}s')
+        except WebDriverException as e:
+            logger.warning(f'Error re-finding card: {e}')
 
     if not parent_container:
         logger.warning(f'Could not find parent container for {model_name}')
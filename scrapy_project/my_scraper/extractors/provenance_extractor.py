@@ -2,22 +2,102 @@
 Provenance extraction functions
 """
 
+import json
 import logging
-import time
-from typing import Dict
+from typing import Dict, List, Optional
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from lxml import html as lxml_html
-from my_scraper.extractors.selenium_utils import click_element
+from my_scraper.extractors.selenium_utils import (
+    cdp_eval,
+    expand_section,
+    get_element_texts,
+    refresh_tree,
+    wait_for_expanded,
+)
+from my_scraper.utils import compile_css, compile_xpath, classify_selectors
 
 logger = logging.getLogger(__name__)
 
 
+def _extract_from_tree(tree: lxml_html.HtmlElement, selector_list: List[str]) -> str:
+    """
+    Resolve provenance selectors purely against the parsed tree
+
+    Both CSS (via cssselect) and XPath selectors are evaluated in-process,
+    with no WebDriver round trips.
+
+    Args:
+        tree: lxml tree object
+        selector_list: Configured selectors (CSS or XPath)
+
+    Returns:
+        First non-empty element text, or empty string
+    """
+    for is_css, selector in classify_selectors(selector_list):
+        try:
+            if is_css:
+                logger.debug(f"Trying provenance CSS selector: {selector}")
+                elements = compile_css(selector)(tree)
+            else:
+                logger.debug(f"Trying provenance XPath selector: {selector}")
+                elements = compile_xpath(selector)(tree)
+            logger.debug("Found %s provenance elements", len(elements))
+
+            for elem in elements:
+                text = elem.text_content().strip()
+                if text:
+                    logger.info(f"Found provenance using selector: {selector}")
+                    return text
+
+        except Exception as e:
+            logger.debug(f"Provenance selector {selector} failed: {e}")
+            continue
+
+    return ""
+
+
+def _expanded_fragment(driver: webdriver.Chrome,
+                       action_selector: str) -> Optional[lxml_html.HtmlElement]:
+    """
+    Parse just the freshly expanded section instead of the full page
+
+    Fetches the outerHTML of the section enclosing the expand button in
+    one JS evaluation, avoiding the full page_source serialization and
+    re-parse after an expansion click.
+
+    Args:
+        driver: Selenium driver instance
+        action_selector: CSS selector for the expand button
+
+    Returns:
+        Parsed fragment tree, or None when the section cannot be found
+    """
+    try:
+        fragment = cdp_eval(driver, (
+            "(() => {"
+            "const el = document.querySelector(%s);"
+            "if (!el) return '';"
+            "const sec = el.closest('section, div.sc-bBhMX');"
+            "return sec ? sec.outerHTML : '';"
+            "})()" % json.dumps(action_selector)
+        ))
+        if fragment:
+            return lxml_html.fromstring(fragment)
+    except Exception as e:
+        logger.debug(f"Could not fetch expanded fragment: {e}")
+    return None
+
+
 def extract_provenance(driver: webdriver.Chrome, tree: lxml_html.HtmlElement,
                       selectors: Dict, name: str) -> str:
     """
     Extract provenance information using configured selectors
 
+    When the provenance section is already expanded (or has no expand
+    button), all selectors are resolved against the parsed tree without
+    touching the WebDriver. Selenium is only involved when the section
+    actually has to be clicked open.
+
     Args:
         driver: Selenium driver instance
         tree: lxml tree object
@@ -37,71 +117,43 @@ def extract_provenance(driver: webdriver.Chrome, tree: lxml_html.HtmlElement,
     try:
         logger.debug(f"Starting provenance extraction for {name}")
 
-        # Try to click the action button if configured (to expand provenance section)
+        # Expand the section only if it is actually collapsed
+        expanded = False
         action_selector = selectors.get('provenance_action')
         if action_selector:
-            try:
-                logger.debug(f"Looking for provenance action button: {action_selector}")
-                button = driver.find_element(By.CSS_SELECTOR, action_selector)
-
-                # Check if the section is collapsed (aria-expanded="false")
-                aria_expanded = button.get_attribute('aria-expanded')
-                logger.debug(f"Provenance section aria-expanded: {aria_expanded}")
-
-                if aria_expanded == 'false':
-                    logger.info(f"Expanding provenance section for {name}")
-                    if click_element(driver, action_selector):
-                        time.sleep(0.5)  # Wait for expansion animation
-                        # Refresh tree after click
-                        tree = lxml_html.fromstring(driver.page_source)
-            except Exception as e:
-                logger.debug(f"Could not interact with provenance action button: {e}")
-
-        # Try CSS selectors via Selenium first
-        for selector in selectors.get('provenance', []):
-            try:
-                if selector.startswith('.') or selector.startswith('#') or selector.startswith('div'):
-                    # CSS selector - use Selenium
-                    logger.debug(f"Trying provenance CSS selector: {selector}")
-                    elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                    logger.debug(f"Found {len(elements)} provenance elements")
-
-                    for elem in elements:
-                        try:
-                            text = elem.text.strip()
-                            if text:
-                                provenance_text = text
-                                logger.info(f"Found provenance using CSS selector: {selector}")
-                                break
-                        except Exception as e:
-                            logger.debug(f"Error extracting text from element: {e}")
-                            continue
-
-                    if provenance_text:
+            result = expand_section(driver, action_selector)
+            logger.debug(f"Provenance action button {action_selector}: {result}")
+            if result == 'clicked':
+                logger.info(f"Expanding provenance section for {name}")
+                wait_for_expanded(driver, action_selector)
+                # Re-parse only the expanded section; fall back to a
+                # full (cached) refresh if the section can't be isolated
+                tree = _expanded_fragment(driver, action_selector) or refresh_tree(driver)
+                expanded = True
+
+        # Resolve everything against the parsed tree - no WebDriver
+        # command per selector
+        provenance_selectors = selectors.get('provenance', [])
+        provenance_text = _extract_from_tree(tree, provenance_selectors)
+
+        if not provenance_text and expanded:
+            # The freshly expanded content may not have been in the page
+            # source snapshot yet - fall back to a live read
+            for is_css, selector in classify_selectors(provenance_selectors):
+                if not is_css:
+                    continue
+                try:
+                    texts = get_element_texts(driver, selector)
+                except Exception as e:
+                    logger.debug(f"Provenance selector {selector} failed: {e}")
+                    continue
+                for text in texts:
+                    if text.strip():
+                        provenance_text = text.strip()
+                        logger.info(f"Found provenance using CSS selector: {selector}")
                         break
-                else:
-                    # XPath selector - use lxml
-                    logger.debug(f"Trying provenance XPath selector: {selector}")
-                    elements = tree.xpath(selector)
-                    logger.debug(f"Found {len(elements)} provenance elements via XPath")
-
-                    for elem in elements:
-                        try:
-                            text = elem.text_content().strip()
-                            if text:
-                                provenance_text = text
-                                logger.info(f"Found provenance using XPath: {selector}")
-                                break
-                        except Exception as e:
-                            logger.debug(f"Error extracting text from XPath element: {e}")
-                            continue
-
-                    if provenance_text:
-                        break
-
-            except Exception as e:
-                logger.debug(f"Provenance selector {selector} failed: {e}")
-                continue
+                if provenance_text:
+                    break
 
         if provenance_text:
             logger.info(f"Successfully extracted provenance for {name}")
@@ -2,6 +2,7 @@
 Selenium utility functions for web scraping
 """
 
+import json
 import logging
 import time
 from typing import Optional, List
@@ -10,10 +11,97 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.remote.webelement import WebElement
+from selenium.common.exceptions import TimeoutException, WebDriverException
 from lxml import html as lxml_html
 
 logger = logging.getLogger(__name__)
 
+# One reused parser for every page parse - skips per-call parser
+# construction and the ID hash table (unused by our xpath/cssselect flows)
+_HTML_PARSER = lxml_html.HTMLParser(recover=True, collect_ids=False)
+
+
+class DomCache:
+    """
+    Parsed-tree cache shared by extractors running against one driver
+
+    Avoids re-running lxml_html.fromstring on an unchanged page_source
+    when several extractors refresh the tree after expansion clicks.
+    """
+    __slots__ = ('fingerprint', 'src_hash', 'tree')
+
+    def __init__(self):
+        self.fingerprint = None
+        self.src_hash = None
+        self.tree = None
+
+
+# Cheap in-browser DOM fingerprint: detects changes without shipping the
+# full serialized page over the wire. Collisions only cost a redundant
+# hash check, since page_source is still hashed before re-parsing.
+_FINGERPRINT_JS = (
+    "document.documentElement"
+    " ? document.documentElement.childElementCount + ':' +"
+    "   document.documentElement.innerHTML.length"
+    " : ''"
+)
+
+
+def refresh_tree(driver: webdriver.Chrome) -> lxml_html.HtmlElement:
+    """
+    Get a parsed tree for the driver's current page source
+
+    Re-parses only when page_source actually changed since the last call;
+    otherwise returns the cached tree.
+
+    Args:
+        driver: Selenium driver instance
+
+    Returns:
+        lxml HtmlElement tree for the current page
+    """
+    cache = getattr(driver, '_dom_cache', None)
+    if cache is None:
+        cache = DomCache()
+        driver._dom_cache = cache
+
+    # Cheap change check first: a tiny fingerprint round trip instead of
+    # serializing the whole page just to discover nothing changed
+    if cache.tree is not None:
+        try:
+            if cdp_eval(driver, _FINGERPRINT_JS) == cache.fingerprint:
+                return cache.tree
+        except WebDriverException:
+            pass
+
+    page_source = driver.page_source
+    src_hash = hash(page_source)
+    if cache.tree is None or cache.src_hash != src_hash:
+        cache.tree = lxml_html.fromstring(page_source, parser=_HTML_PARSER)
+        cache.src_hash = src_hash
+    try:
+        cache.fingerprint = cdp_eval(driver, _FINGERPRINT_JS)
+    except WebDriverException:
+        cache.fingerprint = None
+    return cache.tree
+
+
+def prefetch_dom(driver: webdriver.Chrome) -> lxml_html.HtmlElement:
+    """
+    Fetch and parse the driver's DOM once, seeding the shared cache
+
+    Call this once at the top of a page's extraction flow; every later
+    refresh_tree call (e.g. after an expand click that turns out to be a
+    no-op) reuses the cached tree instead of re-fetching and re-parsing.
+
+    Args:
+        driver: Selenium driver instance
+
+    Returns:
+        lxml HtmlElement tree for the current page
+    """
+    return refresh_tree(driver)
+
 
 def get_driver_from_response(response) -> Optional[webdriver.Chrome]:
     """
@@ -43,10 +131,11 @@ def parse_tree_from_response(response, driver: Optional[webdriver.Chrome] = None
     # If driver is provided, use its current page source (for post-navigation parsing)
     # Otherwise, use response.text which contains the page source captured by middleware
     if driver is not None:
-        page_source = driver.page_source
-        return lxml_html.fromstring(page_source)
+        # Route through the shared per-driver cache: extractors asking
+        # for the same unchanged page reuse one parsed tree
+        return refresh_tree(driver)
     else:
-        return lxml_html.fromstring(response.text)
+        return lxml_html.fromstring(response.text, parser=_HTML_PARSER)
 
 
 def wait_for_element(driver: webdriver.Chrome, selector: str,
@@ -67,7 +156,7 @@ def wait_for_element(driver: webdriver.Chrome, selector: str,
         wait = WebDriverWait(driver, timeout)
         element = wait.until(EC.presence_of_element_located((by, selector)))
         return element
-    except Exception as e:
+    except (TimeoutException, WebDriverException) as e:
         logger.debug(f"Element not found: {selector} - {e}")
         return None
 
@@ -85,22 +174,119 @@ def click_element(driver: webdriver.Chrome, selector: str,
     Returns:
         True if clicked successfully, False otherwise
     """
+    # JS click first: the elements this module clicks (expand toggles,
+    # popup dismissal targets) all respond to synthetic clicks, and the
+    # JS dispatch skips the native click's scroll-and-hit-test overhead
     try:
+        if by == By.CSS_SELECTOR:
+            clicked = driver.execute_script(
+                "const el = document.querySelector(arguments[0]);"
+                "if (!el) return false;"
+                "el.click();"
+                "return true;",
+                selector
+            )
+            if clicked:
+                logger.debug(f"Clicked element via JS: {selector}")
+                return True
+            logger.debug(f"Could not click element: {selector} - not found")
+            return False
+
         element = driver.find_element(by, selector)
-        try:
-            element.click()
-            logger.debug(f"Clicked element: {selector}")
-            return True
-        except Exception:
-            # Try JavaScript click as fallback
-            driver.execute_script("arguments[0].click();", element)
-            logger.debug(f"Clicked element via JS: {selector}")
-            return True
-    except Exception as e:
+        driver.execute_script("arguments[0].click();", element)
+        logger.debug(f"Clicked element via JS: {selector}")
+        return True
+    except WebDriverException as e:
         logger.debug(f"Could not click element: {selector} - {e}")
         return False
 
 
+def cdp_eval(driver: webdriver.Chrome, expression: str):
+    """
+    Evaluate a JavaScript expression over the Chrome DevTools Protocol
+
+    CDP skips the W3C WebDriver command plumbing, so simple by-value
+    evaluations complete noticeably faster than execute_script. Falls
+    back to execute_script when the CDP endpoint is unavailable (e.g.
+    non-Chrome drivers).
+
+    Args:
+        driver: Selenium driver instance
+        expression: JavaScript expression (arguments[] is not available;
+                    embed values with json.dumps)
+
+    Returns:
+        The expression's value, JSON-deserialized
+    """
+    try:
+        result = driver.execute_cdp_cmd(
+            'Runtime.evaluate',
+            {'expression': expression, 'returnByValue': True}
+        )
+        return result.get('result', {}).get('value')
+    except (AttributeError, WebDriverException) as e:
+        logger.debug(f"CDP evaluate unavailable, using execute_script: {e}")
+        return driver.execute_script('return ' + expression)
+
+
+def expand_section(driver: webdriver.Chrome, css_selector: str) -> str:
+    """
+    Check an aria-expanded toggle and click it if collapsed, in one
+    JavaScript round trip
+
+    Replaces the find_element / get_attribute / click sequence (three
+    WebDriver hops) used to expand collapsible sections.
+
+    Args:
+        driver: Selenium driver instance
+        css_selector: CSS selector for the toggle button
+
+    Returns:
+        'clicked', 'already_open' or 'not_found'
+    """
+    try:
+        return cdp_eval(driver, (
+            "(() => {"
+            "const el = document.querySelector(%s);"
+            "if (!el) return 'not_found';"
+            "if (el.getAttribute('aria-expanded') !== 'false') return 'already_open';"
+            "el.click();"
+            "return 'clicked';"
+            "})()" % json.dumps(css_selector)
+        ))
+    except WebDriverException as e:
+        logger.debug(f"Could not expand section {css_selector}: {e}")
+        return 'not_found'
+
+
+def wait_for_expanded(driver: webdriver.Chrome, css_selector: str,
+                      timeout: float = 2) -> None:
+    """
+    Wait until an aria-expanded toggle reports 'true'
+
+    Returns as soon as the DOM reflects the expanded state instead of
+    sleeping a fixed worst-case interval; falls back to a short sleep if
+    the attribute never flips within the timeout.
+
+    Args:
+        driver: Selenium driver instance
+        css_selector: CSS selector for the toggle button
+        timeout: Wait timeout in seconds
+    """
+    expr = (
+        "(() => {"
+        "const el = document.querySelector(%s);"
+        "return !!el && el.getAttribute('aria-expanded') === 'true';"
+        "})()" % json.dumps(css_selector)
+    )
+    try:
+        WebDriverWait(driver, timeout, poll_frequency=0.05).until(
+            lambda d: cdp_eval(d, expr)
+        )
+    except (TimeoutException, WebDriverException):
+        time.sleep(0.1)
+
+
 def click_element_with_fallback(driver: webdriver.Chrome, element: WebElement) -> bool:
     """
     Try to click a WebElement (with JS fallback)
@@ -112,19 +298,20 @@ def click_element_with_fallback(driver: webdriver.Chrome, element: WebElement) -
     Returns:
         True if clicked successfully, False otherwise
     """
+    # JS click directly - one round trip, no scroll-and-hit-test; fall
+    # back to the native click only if the script dispatch itself fails
     try:
+        driver.execute_script("arguments[0].click();", element)
+        logger.debug("Clicked element via JS")
+        return True
+    except WebDriverException:
         try:
             element.click()
-            logger.debug("Clicked element successfully")
-            return True
-        except Exception:
-            # Try JavaScript click as fallback
-            driver.execute_script("arguments[0].click();", element)
-            logger.debug("Clicked element via JS fallback")
+            logger.debug("Clicked element via native fallback")
             return True
-    except Exception as e:
-        logger.debug(f"Could not click element: {e}")
-        return False
+        except WebDriverException as e:
+            logger.debug(f"Could not click element: {e}")
+            return False
 
 
 def scroll_element_into_view(driver: webdriver.Chrome, element: WebElement,
@@ -143,7 +330,7 @@ def scroll_element_into_view(driver: webdriver.Chrome, element: WebElement,
         if delay > 0:
             time.sleep(delay)
         logger.debug(f"Scrolled element into view (block={block})")
-    except Exception as e:
+    except WebDriverException as e:
         logger.debug(f"Could not scroll element into view: {e}")
 
 
@@ -156,14 +343,38 @@ def close_popup(driver: webdriver.Chrome, delay: float = 0.3) -> None:
         delay: Delay in seconds after closing (default: 0.3)
     """
     try:
-        driver.execute_script("document.body.click();")
+        cdp_eval(driver, "(document.body.click(), true)")
         if delay > 0:
             time.sleep(delay)
         logger.debug("Closed popup")
-    except Exception as e:
+    except WebDriverException as e:
         logger.debug(f"Could not close popup: {e}")
 
 
+def get_element_texts(driver: webdriver.Chrome, css_selector: str) -> List[str]:
+    """
+    Get trimmed innerText for every element matching a CSS selector in a
+    single JavaScript round trip
+
+    Avoids the per-element WebDriver round trip of find_elements + .text.
+
+    Args:
+        driver: Selenium driver instance
+        css_selector: CSS selector to match
+
+    Returns:
+        List of text strings (may contain empty strings)
+    """
+    try:
+        return cdp_eval(driver, (
+            "Array.from(document.querySelectorAll(%s))"
+            ".map(e => e.innerText.trim())" % json.dumps(css_selector)
+        )) or []
+    except WebDriverException as e:
+        logger.debug(f"Batch text extraction failed for {css_selector}: {e}")
+        return []
+
+
 def get_element_text(element: WebElement, fallback: str = '') -> str:
     """
     Safely get text from a WebElement
@@ -178,7 +389,7 @@ def get_element_text(element: WebElement, fallback: str = '') -> str:
     try:
         text = element.text.strip()
         return text if text else fallback
-    except Exception as e:
+    except WebDriverException as e:
         logger.debug(f"Could not get element text: {e}")
         return fallback
 
@@ -198,7 +409,7 @@ def get_element_attribute(element: WebElement, attribute: str, fallback: str = '
     try:
         value = element.get_attribute(attribute)
         return value.strip() if value else fallback
-    except Exception as e:
+    except WebDriverException as e:
         logger.debug(f"Could not get element attribute '{attribute}': {e}")
         return fallback
 
@@ -223,8 +434,8 @@ def find_elements_by_parent(driver: webdriver.Chrome, parent_selector: str,
         for parent in parents:
             try:
                 children.extend(parent.find_elements(by, child_selector))
-            except Exception:
+            except WebDriverException:
                 continue
-    except Exception as e:
+    except WebDriverException as e:
         logger.debug(f"Could not find elements: {e}")
     return children
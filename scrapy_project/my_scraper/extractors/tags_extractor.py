@@ -3,25 +3,77 @@ Tags extraction functions
 """
 
 import logging
-import time
+import re
+from functools import lru_cache
 from typing import Dict, Set
 from selenium import webdriver
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from lxml import etree
 from lxml import html as lxml_html
 
-from .selenium_utils import (
-    scroll_element_into_view,
-    click_element_with_fallback,
-    close_popup,
-    get_element_text,
-    get_element_attribute
-)
+from my_scraper.utils import compile_css
+from .selenium_utils import close_popup, refresh_tree
 
 logger = logging.getLogger(__name__)
 
+# Accessibility suffixes to strip, as one alternation - a single scan
+# instead of four sequential str.replace passes per tag
+_ACCESSIBILITY_RE = re.compile(r',?\s*opens in (?:a )?new window')
+
+# Fallback: links inside the containers enclosing the first two
+# 'TAGS'/'Tags' headings, resolved in one compiled XPath pass
+_FALLBACK_TAGS_XPATH = etree.XPath(
+    "(//*[contains(text(), 'TAGS') or contains(text(), 'Tags')])"
+    "[position() <= 2]/ancestor::div[2]//a"
+)
+
+# Navigation link text that shows up near the headings but isn't a tag
+_NON_TAG_WORDS = frozenset({'home', 'models', 'datasets', 'code', 'competitions', 'learn'})
+
+# Dash/underscore to space in one table-driven pass for href tag slugs
+_URL_WORD_TBL = str.maketrans('-_', '  ')
+
+
+@lru_cache(maxsize=32)
+def _combined_tags_xpath(tag_selectors: tuple) -> etree.XPath:
+    """
+    Compile the configured container selectors into one XPath union
+
+    Each selector (CSS or XPath) is extended to its anchor descendants
+    and the parts are joined with '|', so one traversal of the tree
+    yields every candidate tag link. Cached per selector tuple.
+
+    Args:
+        tag_selectors: Tuple of configured 'tags' selectors
+
+    Returns:
+        Compiled XPath returning the matched anchor elements
+    """
+    parts = []
+    for selector in tag_selectors:
+        try:
+            if selector.startswith('.') or selector.startswith('#'):
+                parts.append(compile_css(selector).path + '//a')
+            else:
+                parts.append(selector + '//a')
+        except Exception as e:
+            logger.debug(f"Skipping unparseable tags selector {selector}: {e}")
+    return etree.XPath(' | '.join(parts))
+
+
+def _fast_title(text: str) -> str:
+    """
+    Title-case an ASCII tag slug without str.title's locale handling
+
+    Args:
+        text: Space-separated words derived from a /tag/ URL slug
+
+    Returns:
+        Text with each word's first letter upper-cased
+    """
+    return ' '.join(w[:1].upper() + w[1:] for w in text.split())
+
 
 def clean_tag_text(tag_text: str) -> str:
     """
@@ -37,12 +89,7 @@ def clean_tag_text(tag_text: str) -> str:
         return ''
 
     # Remove common accessibility suffixes
-    tag_text = tag_text.replace(' opens in new window', '')
-    tag_text = tag_text.replace(' opens in a new window', '')
-    tag_text = tag_text.replace(', opens in new window', '')
-    tag_text = tag_text.replace(', opens in a new window', '')
-
-    return tag_text.strip()
+    return _ACCESSIBILITY_RE.sub('', tag_text).strip()
 
 
 def extract_tags_from_more_buttons(driver: webdriver.Chrome, selectors: Dict) -> Set[str]:
@@ -67,91 +114,105 @@ def extract_tags_from_more_buttons(driver: webdriver.Chrome, selectors: Dict) ->
 
         logger.debug("Looking for 'more' buttons to expand tags")
 
-        # Find all buttons that contain the "more" text span
-        more_text_spans = driver.find_elements(By.CSS_SELECTOR, more_button_span)
-
-        # Get the parent buttons
-        more_buttons = []
-        for span in more_text_spans:
-            try:
-                # Check if the span text contains "more"
-                if 'more' in span.text.lower():
-                    button = span.find_element(By.XPATH, './ancestor::button[@role="button"]')
-                    if button and button not in more_buttons:
-                        more_buttons.append(button)
-            except Exception:
-                continue
-
-        if not more_buttons:
+        # One in-page probe: filter spans and mark each qualifying
+        # ancestor button with a data attribute, so the common "no
+        # hidden tags" case costs a single round trip instead of a
+        # .text read plus ancestor lookup per span
+        marked = driver.execute_script(
+            "let n = 0;"
+            "document.querySelectorAll(arguments[0]).forEach(s => {"
+            "  if (/more/i.test(s.textContent)) {"
+            "    const b = s.closest('button[role=\"button\"]');"
+            "    if (b && !b.hasAttribute('data-tag-extractor-id')) {"
+            "      b.setAttribute('data-tag-extractor-id', String(n++));"
+            "    }"
+            "  }"
+            "});"
+            "return n;",
+            more_button_span
+        ) or 0
+
+        if not marked:
             logger.debug("No 'more' buttons found")
             return all_tags
 
-        logger.info(f"Found {len(more_buttons)} 'more' buttons to click")
+        logger.info(f"Found {marked} 'more' buttons to click")
 
-        # Click each more button and extract tags from the popup
+        # Click each more button and extract tags from the popup. The
+        # data attribute addresses each button in-page, so no element
+        # handles cross the wire and the click cannot go stale.
         buttons_clicked = 0
-        for i, button in enumerate(more_buttons):
+        for i in range(marked):
             try:
-                # Get button text for logging
-                button_text = get_element_text(button, f'button {i+1}')
-                logger.debug(f"Clicking button {i+1}/{len(more_buttons)}: '{button_text}'")
-
-                # Scroll button into view and click
-                scroll_element_into_view(driver, button)
-
-                # Click the button
-                if not click_element_with_fallback(driver, button):
+                logger.debug(f"Clicking button {i+1}/{marked}")
+
+                # Scroll to and click the button in one JS dispatch: the
+                # old flow spent ~5 serialized round trips per button
+                # (text read, scroll, click with fallbacks); this is one
+                clicked = driver.execute_script(
+                    "const b = document.querySelector("
+                    "  '[data-tag-extractor-id=\"' + arguments[0] + '\"]');"
+                    "if (!b) return false;"
+                    "b.scrollIntoView({block: 'center'});"
+                    "b.click();"
+                    "return true;",
+                    str(i)
+                )
+                if not clicked:
                     logger.debug(f"Failed to click button {i+1}, skipping")
                     continue
 
                 buttons_clicked += 1
-                time.sleep(0.5)  # Wait for popup to appear
 
-                # Find the popup div
+                # Find the popup div - the wait below already handles its
+                # appearance, so no fixed post-click sleep. Real popups
+                # show within ~200ms; the short timeout only bounds the
+                # failure path. Staleness is handled by close_popup at the
+                # end of each iteration, so a visible popup here is the
+                # one this click opened.
                 try:
-                    wait = WebDriverWait(driver, 3)
-                    popup = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, popup_container)))
-
-                    # Extract all tags from the popup
-                    tag_buttons = popup.find_elements(By.CSS_SELECTOR, popup_checkbox)
-
-                    for tag_button in tag_buttons:
-                        # Get the aria-label which contains the tag name
-                        tag_name = get_element_attribute(tag_button, 'aria-label')
+                    # One wait whose predicate both detects the popup and
+                    # harvests every checkbox label (aria-label, or the
+                    # span texts as fallback) - each poll is a single
+                    # round trip and the labels arrive with the wait
+                    # result, with no post-wait scan
+                    def _popup_tags_ready(d):
+                        return d.execute_script(
+                            "const popup = document.querySelector(arguments[0]);"
+                            "if (!popup) return null;"
+                            "const boxes = Array.from(popup.querySelectorAll(arguments[1]));"
+                            "if (!boxes.length) return null;"
+                            "return boxes.map(b => b.getAttribute('aria-label')"
+                            " || Array.from(b.querySelectorAll(arguments[2]))"
+                            ".map(s => s.textContent).join(' '));",
+                            popup_container, popup_checkbox, popup_text_span
+                        )
+
+                    wait = WebDriverWait(driver, 1.5, poll_frequency=0.05)
+                    labels = wait.until(_popup_tags_ready)
+
+                    for label in labels:
+                        tag_name = clean_tag_text(label)
                         if tag_name:
-                            tag_name = clean_tag_text(tag_name)
-                            if tag_name:
-                                all_tags.add(tag_name)
-                        else:
-                            # Fallback: get text from span
-                            tag_spans = tag_button.find_elements(By.CSS_SELECTOR, popup_text_span)
-                            for span in tag_spans:
-                                tag_text = get_element_text(span)
-                                if tag_text:
-                                    tag_text = clean_tag_text(tag_text)
-                                    if tag_text:
-                                        all_tags.add(tag_text)
-
-                    logger.debug(f"Extracted {len(tag_buttons)} tags from popup")
+                            all_tags.add(tag_name)
+
+                    logger.debug(f"Extracted {len(labels)} tags from popup")
 
                     # Close the popup
                     close_popup(driver)
 
                 except TimeoutException:
                     logger.debug(f"Popup did not appear for button {i+1}")
-                except Exception as e:
+                except WebDriverException as e:
                     logger.debug(f"Error extracting tags from popup: {e}")
 
-            except StaleElementReferenceException:
-                logger.debug(f"Button {i+1} became stale, skipping")
-                continue
-            except Exception as e:
+            except WebDriverException as e:
                 logger.debug(f"Error clicking button {i+1}: {e}")
                 continue
 
         logger.info(f"Clicked {buttons_clicked} 'more' buttons and found {len(all_tags)} additional tags")
 
-    except Exception as e:
+    except WebDriverException as e:
         logger.error(f"Error in extract_tags_from_more_buttons: {e}")
 
     return all_tags
@@ -172,171 +233,150 @@ def extract_tags(driver: webdriver.Chrome, tree: lxml_html.HtmlElement,
         List of tag strings
     """
     tags = []
+    seen = set()  # casefolded keys for O(1) dedup across all branches
 
     # If no driver, can't extract tags (requires JavaScript rendering)
     if not driver:
         logger.debug(f"No driver provided, skipping tags extraction for {name}")
         return []
 
-    try:
-        logger.debug(f"Starting tag extraction for {name}")
-
-        # First, try to extract tags from hidden "more" buttons
-        logger.debug("Checking for hidden tags in 'more' buttons")
-        hidden_tags = extract_tags_from_more_buttons(driver, selectors)
-        if hidden_tags:
-            logger.info(f"Found {len(hidden_tags)} tags from 'more' buttons")
-            tags.extend(list(hidden_tags))
-
-        # Then try the specific tag link selector
-        tag_link_selector = selectors.get('tag_links')
-        if tag_link_selector:
-            logger.debug(f"Trying specific tag link selector: {tag_link_selector}")
-            try:
-                tag_links = driver.find_elements(By.CSS_SELECTOR, tag_link_selector)
-                logger.debug(f"Found {len(tag_links)} tag links")
-
-                tags_before = len(tags)
-                skipped_empty = 0
-                skipped_duplicates = 0
-
-                for link in tag_links:
-                    try:
-                        # Try to get text from element
-                        tag_text = link.text.strip()
-
-                        # If no visible text, try aria-label or title attributes
-                        if not tag_text:
-                            tag_text = link.get_attribute('aria-label')
-                            if tag_text:
-                                tag_text = tag_text.strip()
-
-                        if not tag_text:
-                            tag_text = link.get_attribute('title')
-                            if tag_text:
-                                tag_text = tag_text.strip()
-
-                        # If still no text, try to get from href (last part after /)
-                        if not tag_text:
-                            href = link.get_attribute('href')
-                            if href and '/tag/' in href:
-                                tag_text = href.split('/tag/')[-1].strip('/')
-                                tag_text = tag_text.replace('-', ' ').replace('_', ' ').title()
-
-                        # Clean up accessibility text from tags
-                        tag_text = clean_tag_text(tag_text)
-
-                        if tag_text:
-                            if tag_text not in tags:
-                                tags.append(tag_text)
-                            else:
-                                skipped_duplicates += 1
-                        else:
-                            skipped_empty += 1
-                            logger.debug(f"Tag link has no text, aria-label, title, or href info")
-                    except Exception as e:
-                        logger.debug(f"Error extracting tag from link: {e}")
-                        continue
-
-                tags_added = len(tags) - tags_before
-                if tags_added > 0:
-                    log_msg = f"Found {tags_added} new tags using specific selector"
-                    if skipped_duplicates > 0:
-                        log_msg += f" ({skipped_duplicates} duplicates skipped"
-                        if skipped_empty > 0:
-                            log_msg += f", {skipped_empty} empty tags skipped)"
-                        else:
-                            log_msg += ")"
-                    elif skipped_empty > 0:
-                        log_msg += f" ({skipped_empty} empty tags skipped)"
-                    logger.info(log_msg)
-                elif skipped_empty > 0 or skipped_duplicates > 0:
-                    logger.debug(f"No new tags added: {skipped_duplicates} duplicates, {skipped_empty} empty")
-
-            except Exception as e:
-                logger.debug(f"Specific tag link selector failed: {e}")
-
-        # If specific selector failed, try container selectors
-        for selector in selectors.get('tags', []):
-            try:
-                if selector.startswith('.') or selector.startswith('#'):
-                    # CSS selector - use Selenium
-                    tag_containers = driver.find_elements(By.CSS_SELECTOR, selector)
-
-                    for container in tag_containers:
-                        anchor_tags = container.find_elements(By.TAG_NAME, 'a')
-
-                        for anchor in anchor_tags:
-                            try:
-                                tag_text = anchor.text.strip()
-                                if tag_text and tag_text not in tags:
-                                    tags.append(tag_text)
-                            except Exception:
-                                continue
-                else:
-                    # XPath selector - use lxml
-                    tag_elements = tree.xpath(selector)
-
-                    for elem in tag_elements:
-                        anchor_elements = elem.xpath('.//a')
-
-                        for anchor in anchor_elements:
-                            try:
-                                tag_text = anchor.text_content().strip()
-                                if tag_text and tag_text not in tags:
-                                    tags.append(tag_text)
-                            except Exception:
-                                continue
+    logger.debug(f"Starting tag extraction for {name}")
 
-                if tags:
-                    break
+    # Each strategy runs in its own try/except: a failure in one must
+    # not discard tags already collected or skip the strategies after it
 
-            except Exception as e:
-                logger.debug(f"Container selector {selector} failed: {e}")
-                continue
-
-        # Fallback: Look for links near "TAGS" or "Tags" heading
-        if not tags:
-            logger.debug(f"Trying fallback: searching for links near 'TAGS' heading")
-            try:
-                # Find TAGS heading
-                tags_heading = driver.find_elements(By.XPATH, "//*[contains(text(), 'TAGS') or contains(text(), 'Tags')]")
-
-                if tags_heading:
-                    logger.debug(f"Found {len(tags_heading)} 'TAGS' headings")
-
-                    # Look for nearby links
-                    for heading in tags_heading[:2]:
-                        try:
-                            # Try to find parent container
-                            parent = heading.find_element(By.XPATH, './ancestor::div[2]')
-                            # Find all links in the container
-                            links = parent.find_elements(By.TAG_NAME, 'a')
-
-                            for link in links:
-                                tag_text = link.text.strip()
-                                if tag_text and tag_text not in tags:
-                                    # Filter out common non-tag link text
-                                    if tag_text.lower() not in ['home', 'models', 'datasets', 'code', 'competitions', 'learn']:
-                                        tags.append(tag_text)
-                                        logger.debug(f"Found tag via fallback: {tag_text}")
-                        except Exception:
-                            continue
-
-                    if tags:
-                        logger.info(f"Found {len(tags)} tags using fallback method")
+    # First, try to extract tags from hidden "more" buttons
+    logger.debug("Checking for hidden tags in 'more' buttons")
+    try:
+        hidden_tags = extract_tags_from_more_buttons(driver, selectors)
+    except WebDriverException as e:
+        logger.error(f"'more'-button strategy failed for {name}: {e}")
+        hidden_tags = set()
+    if hidden_tags:
+        logger.info(f"Found {len(hidden_tags)} tags from 'more' buttons")
+        tags.extend(list(hidden_tags))
+        seen.update(t.casefold() for t in hidden_tags)
+
+    # The supplied tree may predate the JS render (and the clicks
+    # above mutate the DOM), so take one live snapshot and resolve
+    # all remaining selectors in-process - Selenium is only used for
+    # interaction from here on
+    try:
+        tree = refresh_tree(driver)
+    except (WebDriverException, etree.ParserError) as e:
+        logger.debug(f"Could not refresh tree, using supplied one: {e}")
+
+    # Then try the specific tag link selector
+    tag_link_selector = selectors.get('tag_links')
+    if tag_link_selector:
+        logger.debug(f"Trying specific tag link selector: {tag_link_selector}")
+        try:
+            # Read text, aria-label, title and href for every link
+            # from the parsed tree - no WebDriver commands at all
+            rows = [
+                (a.text_content(), a.get('aria-label'),
+                 a.get('title'), a.get('href'))
+                for a in compile_css(tag_link_selector)(tree)
+            ]
+            logger.debug(f"Found {len(rows)} tag links")
+
+            tags_before = len(tags)
+            skipped_empty = 0
+            skipped_duplicates = 0
+
+            for text, aria_label, title, href in rows:
+                # Same fallback order as before: visible text, then
+                # aria-label, then title, then the href tag slug
+                tag_text = (text or '').strip()
+
+                if not tag_text and aria_label:
+                    tag_text = aria_label.strip()
+
+                if not tag_text and title:
+                    tag_text = title.strip()
+
+                if not tag_text and href and '/tag/' in href:
+                    tag_text = href.split('/tag/')[-1].strip('/')
+                    tag_text = _fast_title(tag_text.translate(_URL_WORD_TBL))
+
+                # Clean up accessibility text from tags
+                tag_text = clean_tag_text(tag_text)
+
+                if tag_text:
+                    key = tag_text.casefold()
+                    if key not in seen:
+                        seen.add(key)
+                        tags.append(tag_text)
+                    else:
+                        skipped_duplicates += 1
                 else:
-                    logger.debug("No TAGS heading found")
-
-            except Exception as e:
-                logger.debug(f"Fallback tags search failed: {e}")
-
-        if tags:
-            logger.info(f"Successfully extracted {len(tags)} total unique tags for {name}")
-        else:
-            logger.warning(f"Could not find any tags for {name}")
-
-    except Exception as e:
-        logger.error(f"Error extracting tags for {name}: {e}")
+                    skipped_empty += 1
+                    logger.debug("Tag link has no text, aria-label, title, or href info")
+
+            tags_added = len(tags) - tags_before
+            if tags_added > 0:
+                log_msg = f"Found {tags_added} new tags using specific selector"
+                if skipped_duplicates > 0:
+                    log_msg += f" ({skipped_duplicates} duplicates skipped"
+                    if skipped_empty > 0:
+                        log_msg += f", {skipped_empty} empty tags skipped)"
+                    else:
+                        log_msg += ")"
+                elif skipped_empty > 0:
+                    log_msg += f" ({skipped_empty} empty tags skipped)"
+                logger.info(log_msg)
+            elif skipped_empty > 0 or skipped_duplicates > 0:
+                logger.debug(f"No new tags added: {skipped_duplicates} duplicates, {skipped_empty} empty")
+
+        except Exception as e:
+            logger.debug(f"Specific tag link selector failed: {e}")
+
+    # If specific selector failed, try the container selectors - all of
+    # them unioned into one compiled XPath, so the tree is swept once
+    # instead of per selector and per container
+    tag_selectors = selectors.get('tags', [])
+    if not tags and tag_selectors:
+        try:
+            for anchor in _combined_tags_xpath(tuple(tag_selectors))(tree):
+                tag_text = anchor.text_content().strip()
+                if tag_text and tag_text.casefold() not in seen:
+                    seen.add(tag_text.casefold())
+                    tags.append(tag_text)
+        except Exception as e:
+            logger.debug(f"Container selectors failed: {e}")
+
+    # Fallback: Look for links near "TAGS" or "Tags" heading, resolved
+    # entirely against the parsed tree - the old Selenium version cost
+    # a round trip per heading, ancestor and link
+    if not tags:
+        logger.debug(f"Trying fallback: searching for links near 'TAGS' heading")
+        try:
+            links = _FALLBACK_TAGS_XPATH(tree)
+            if not links:
+                # The tree may predate the JS render; re-parse the
+                # live DOM once rather than reading links one by one
+                links = _FALLBACK_TAGS_XPATH(refresh_tree(driver))
+
+            for link in links:
+                tag_text = link.text_content().strip()
+                if tag_text and tag_text.casefold() not in seen:
+                    # Filter out common non-tag link text
+                    if tag_text.lower() not in _NON_TAG_WORDS:
+                        seen.add(tag_text.casefold())
+                        tags.append(tag_text)
+                        logger.debug(f"Found tag via fallback: {tag_text}")
+
+            if tags:
+                logger.info(f"Found {len(tags)} tags using fallback method")
+            else:
+                logger.debug("No tags found near a TAGS heading")
+
+        except Exception as e:
+            logger.debug(f"Fallback tags search failed: {e}")
+
+    if tags:
+        logger.info(f"Successfully extracted {len(tags)} total unique tags for {name}")
+    else:
+        logger.warning(f"Could not find any tags for {name}")
 
     return tags
@@ -6,8 +6,12 @@ import logging
 from typing import Dict
 from selenium import webdriver
 from selenium.webdriver.common.by import By
+from selenium.common.exceptions import WebDriverException
 from lxml import html as lxml_html
 
+from my_scraper.utils import classify_selectors, compile_css, compile_xpath
+from my_scraper.extractors.selenium_utils import refresh_tree
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,52 +36,69 @@ def extract_usability(driver: webdriver.Chrome, tree: lxml_html.HtmlElement,
         logger.debug(f"No driver provided, skipping usability extraction for {name}")
         return usability
 
-    # Try CSS selectors via Selenium for dynamic content
-    for selector in selectors.get('usability', []):
-        # Check if it's a CSS selector
-        if selector.startswith('.') or selector.startswith('#') or selector.startswith('p') or selector.startswith('div'):
-            try:
-                logger.debug(f"Trying usability CSS selector via Selenium: {selector}")
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                logger.debug(f"Found {len(elements)} elements with CSS selector")
-
-                for elem in elements:
-                    try:
-                        text = elem.text.strip()
-                        logger.debug(f"Checking element text: '{text}'")
-                        if text:
-                            # Found a valid value - return it immediately
-                            logger.info(f"Found usability using selector '{selector}': {text}")
-                            return text
-                    except Exception as e:
-                        logger.debug(f"Error getting text from element: {e}")
-                        continue
-            except Exception as e:
-                logger.debug(f"Usability CSS selector {selector} failed: {e}")
-
-    # Try XPath selectors using lxml tree as fallback
-    for selector in selectors.get('usability', []):
-        # Skip CSS selectors (already tried above)
-        if selector.startswith('.') or selector.startswith('#') or selector.startswith('p') or selector.startswith('div'):
-            continue
-
+    # The supplied tree may predate the JS render; take one cached live
+    # snapshot so the selector pass below stays in-process
+    try:
+        tree = refresh_tree(driver)
+    except Exception as e:
+        logger.debug(f"Could not refresh tree, using supplied one: {e}")
+
+    # Single pass in priority order: each selector is classified once
+    # up front and resolved against the parsed tree; CSS selectors the
+    # tree cannot satisfy are deferred and probed in-browser afterwards
+    unresolved_css = []
+    for is_css, selector in classify_selectors(selectors.get('usability', [])):
         try:
-            logger.debug(f"Trying usability XPath selector: {selector}")
-            usability_elements = tree.xpath(selector)
-            logger.debug(f"Found {len(usability_elements)} elements with XPath")
-
-            if usability_elements:
-                for elem in usability_elements:
-                    text = elem.text_content().strip()
-                    logger.debug(f"Checking element text: '{text}'")
-                    if text:
-                        # Found a valid value - return it immediately
-                        logger.info(f"Found usability using XPath '{selector}': {text}")
-                        return text
+            if is_css:
+                logger.debug(f"Trying usability CSS selector: {selector}")
+                try:
+                    texts = [elem.text_content().strip()
+                             for elem in compile_css(selector)(tree)]
+                except Exception as e:
+                    logger.debug(f"lxml CSS evaluation failed for {selector}: {e}")
+                    texts = []
+                if not any(texts):
+                    unresolved_css.append(selector)
+                    continue
+            else:
+                logger.debug(f"Trying usability XPath selector: {selector}")
+                texts = [elem.text_content().strip()
+                         for elem in compile_xpath(selector)(tree)]
+            logger.debug(f"Found {len(texts)} elements with selector")
+
+            for text in texts:
+                text = text.strip()
+                logger.debug(f"Checking element text: '{text}'")
+                if text:
+                    # Found a valid value - return it immediately
+                    logger.info(f"Found usability using selector '{selector}': {text}")
+                    return text
         except Exception as e:
-            logger.debug(f"Usability XPath selector {selector} failed: {e}")
+            logger.debug(f"Usability selector {selector} failed: {e}")
             continue
 
+    # One JS probe for everything the tree missed: tries the deferred
+    # selectors in order inside the browser and returns the first
+    # non-empty text - a single round trip however many there are
+    if unresolved_css:
+        try:
+            text = driver.execute_script(
+                "for (const s of arguments[0]) {"
+                "  const el = document.querySelector(s);"
+                "  if (el) {"
+                "    const t = (el.innerText || '').trim();"
+                "    if (t) return t;"
+                "  }"
+                "}"
+                "return '';",
+                unresolved_css
+            )
+            if text:
+                logger.info(f"Found usability via in-browser probe: {text}")
+                return text
+        except WebDriverException as e:
+            logger.debug(f"Usability JS probe failed: {e}")
+
     # Fallback: Search for text near "Usability" heading
     if not usability:
         logger.debug(f"Trying fallback: searching for usability near 'Usability' heading")
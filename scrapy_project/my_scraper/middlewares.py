@@ -9,7 +9,7 @@ This module contains custom middlewares for:
 import random
 import logging
 import threading
-from queue import Queue, Empty
+from queue import LifoQueue, Empty
 from scrapy import signals
 from scrapy.http import HtmlResponse
 from selenium import webdriver
@@ -42,7 +42,9 @@ class SeleniumMiddleware:
         self.driver_executable_path = driver_executable_path
         self.driver_arguments = driver_arguments or []
         self.pool_size = pool_size
-        self.driver_pool = Queue()
+        # LIFO: hand out the most recently returned driver first so its
+        # process stays warm in cache while idle drivers sit at the bottom
+        self.driver_pool = LifoQueue()
         self.lock = threading.Lock()
         self.active_drivers = 0
         self.total_requests_processed = 0
@@ -85,12 +87,30 @@ class SeleniumMiddleware:
 
             # Create driver
             if self.driver_executable_path:
-                return webdriver.Chrome(
+                driver = webdriver.Chrome(
                     executable_path=self.driver_executable_path,
                     options=chrome_options
                 )
             else:
-                return webdriver.Chrome(options=chrome_options)
+                driver = webdriver.Chrome(options=chrome_options)
+
+            # Block heavy non-DOM resources at the network level: the
+            # extractors only read DOM text, so skipping images, media,
+            # fonts and analytics speeds navigation and shrinks the
+            # page_source payload. Stylesheets stay enabled because
+            # visibility checks (is_displayed) depend on computed styles.
+            try:
+                driver.execute_cdp_cmd('Network.enable', {})
+                driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': [
+                    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.svg',
+                    '*.woff', '*.woff2', '*.ttf',
+                    '*.mp4', '*.webm',
+                    '*/analytics/*',
+                ]})
+            except Exception as e:
+                logging.debug(f'Could not set blocked URLs on driver: {e}')
+
+            return driver
 
         else:
             raise NotImplementedError(f'Driver {self.driver_name} is not supported')
@@ -3,17 +3,25 @@ Spider Manager Module
 Handles spider detection, management, and execution logic
 """
 
+import ast
+import asyncio
+import json
 import os
 import sys
 import importlib
 import inspect
 import subprocess
 from pathlib import Path
-from typing import List, Dict, Optional
-import scrapy
-from scrapy.utils.project import get_project_settings
-from scrapy.crawler import CrawlerProcess
-from scrapy.spiders import Spider
+from typing import List, Dict, NamedTuple, Optional
+
+
+class SpiderRec(NamedTuple):
+    """Lightweight spider metadata record (shared, immutable)"""
+    name: str
+    description: str
+    module: str
+    parameters: tuple
+    short_description: str
 
 
 class SpiderManager:
@@ -36,85 +44,201 @@ class SpiderManager:
         self._detect_spiders()
 
     def _detect_spiders(self):
-        """Automatically detect all spider classes in the spiders directory"""
+        """Detect all spiders from a lightweight AST-based metadata index"""
         # Add project to path
         sys.path.insert(0, str(self.project_dir))
 
-        # Scan spider files
+        # Two-phase loading: listing reads only the index; the actual spider
+        # modules (and Scrapy) are imported when a spider is run
+        self.detected_spiders = self._index_spiders_via_ast()
+
+    def _index_spiders_via_ast(self) -> List[SpiderRec]:
+        """
+        Build spider metadata by parsing spider files with ast, without
+        executing any module-level code
+
+        The index is persisted to .spider_index.json keyed by file mtime,
+        so unchanged files are never re-parsed.
+        """
+        index_file = self.project_dir / 'my_scraper' / '.spider_index.json'
+
+        try:
+            with open(index_file, 'r', encoding='utf-8') as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            index = {}
+
         spider_files = list(self.spiders_dir.glob('*_spider.py'))
+        file_names = {f.name for f in spider_files}
+        dirty = False
 
-        for spider_file in spider_files:
-            module_name = spider_file.stem
+        # Drop entries for files that no longer exist
+        for stale in [key for key in index if key not in file_names]:
+            del index[stale]
+            dirty = True
 
+        spiders = []
+        for spider_file in spider_files:
+            mtime = spider_file.stat().st_mtime
+            entry = index.get(spider_file.name)
+
+            if not entry or entry.get('mtime') != mtime:
+                try:
+                    entry = {
+                        'mtime': mtime,
+                        'spiders': self._parse_spider_file(spider_file)
+                    }
+                except Exception as e:
+                    print(f"[!] Error indexing {spider_file.stem}: {e}")
+                    entry = {'mtime': mtime, 'spiders': []}
+                index[spider_file.name] = entry
+                dirty = True
+
+            for info in entry['spiders']:
+                description = info['description'] or 'No description'
+                spiders.append(SpiderRec(
+                    name=info['name'],
+                    description=description,
+                    module=info['module'],
+                    parameters=tuple(tuple(p) for p in info.get('parameters', ())),
+                    # Pre-truncated for menu display (50-char column)
+                    short_description=(description if len(description) <= 50
+                                       else description[:47] + '...')
+                ))
+
+        if dirty:
             try:
-                # Import the module
-                module = importlib.import_module(f'my_scraper.spiders.{module_name}')
-
-                # Find all Spider subclasses
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if (issubclass(obj, Spider) and
-                        obj is not Spider and
-                        hasattr(obj, 'name') and
-                        obj.name != 'base_spider'):
-
-                        spider_info = {
-                            'name': obj.name,
-                            'class': obj,
-                            'module': module_name,
-                            'description': self._get_spider_description(obj),
-                            'parameters': self._get_spider_parameters(obj)
-                        }
-                        self.detected_spiders.append(spider_info)
-
-            except Exception as e:
-                print(f"[!] Error loading {module_name}: {e}")
-
-    def _get_spider_description(self, spider_class) -> str:
-        """Extract spider description from docstring"""
-        if spider_class.__doc__:
+                with open(index_file, 'w', encoding='utf-8') as f:
+                    json.dump(index, f, indent=2)
+            except OSError:
+                pass  # Index is an optimization; detection still worked
+
+        return spiders
+
+    def _parse_spider_file(self, spider_file: Path) -> List[Dict]:
+        """Extract spider metadata from one file via ast.parse"""
+        source = spider_file.read_text(encoding='utf-8')
+        module_name = spider_file.stem
+        spiders = []
+
+        for node in ast.parse(source).body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            if not self._is_spider_class(node):
+                continue
+
+            spider_name = self._get_spider_name(node)
+            if not spider_name or spider_name == 'base_spider':
+                continue
+
+            spiders.append({
+                'name': spider_name,
+                'module': module_name,
+                'description': self._get_spider_description(node),
+                'parameters': self._get_spider_parameters(node)
+            })
+
+        return spiders
+
+    @staticmethod
+    def _is_spider_class(node: ast.ClassDef) -> bool:
+        """Check if a class definition looks like a Scrapy spider"""
+        for base in node.bases:
+            if isinstance(base, ast.Name) and base.id.endswith('Spider'):
+                return True
+            if isinstance(base, ast.Attribute) and base.attr.endswith('Spider'):
+                return True
+        return False
+
+    @staticmethod
+    def _get_spider_name(node: ast.ClassDef) -> Optional[str]:
+        """Extract the class-level name = '...' assignment"""
+        for stmt in node.body:
+            if isinstance(stmt, ast.Assign):
+                for target in stmt.targets:
+                    if (isinstance(target, ast.Name) and target.id == 'name' and
+                            isinstance(stmt.value, ast.Constant) and
+                            isinstance(stmt.value.value, str)):
+                        return stmt.value.value
+        return None
+
+    @staticmethod
+    def _get_spider_description(node: ast.ClassDef) -> str:
+        """Extract spider description from the class docstring"""
+        docstring = ast.get_docstring(node)
+        if docstring:
             # Get first line of docstring
-            lines = spider_class.__doc__.strip().split('\n')
+            lines = docstring.strip().split('\n')
             return lines[0].strip() if lines else "No description"
         return "No description"
 
-    def _get_spider_parameters(self, spider_class) -> List[tuple]:
-        """Extract spider parameters from __init__ method"""
+    @staticmethod
+    def _get_spider_parameters(node: ast.ClassDef) -> List[tuple]:
+        """Extract spider parameters from the __init__ signature"""
         params = []
 
-        try:
-            init_method = spider_class.__init__
-            sig = inspect.signature(init_method)
-
-            for param_name, param in sig.parameters.items():
-                if param_name in ['self', 'args', 'kwargs']:
-                    continue
+        for stmt in node.body:
+            if not isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                continue
+            if stmt.name != '__init__':
+                continue
+
+            args = stmt.args
+            positional = args.args
+            offset = len(positional) - len(args.defaults)
+
+            def add_param(arg, default_node):
+                if arg.arg in ['self', 'args', 'kwargs']:
+                    return
+                default = None
+                if default_node is not None:
+                    try:
+                        default = ast.literal_eval(default_node)
+                    except (ValueError, SyntaxError):
+                        default = None
 
-                default = param.default if param.default != inspect.Parameter.empty else None
                 param_type = "str"  # Default type
-
-                # Try to infer type from default value
                 if default is not None:
                     param_type = type(default).__name__
 
-                params.append((param_name, param_type, str(default)))
+                params.append((arg.arg, param_type, str(default)))
 
-        except Exception:
-            pass
+            for i, arg in enumerate(positional):
+                add_param(arg, args.defaults[i - offset] if i >= offset else None)
+
+            for arg, default_node in zip(args.kwonlyargs, args.kw_defaults):
+                add_param(arg, default_node)
+
+            break
 
         return params
 
-    def get_all_spiders(self) -> List[Dict]:
+    def _load_spider_class(self, spider_info: SpiderRec):
+        """Import the spider module and return the matching Spider class"""
+        from scrapy.spiders import Spider
+
+        module = importlib.import_module(f"my_scraper.spiders.{spider_info.module}")
+
+        for _, obj in inspect.getmembers(module, inspect.isclass):
+            if (issubclass(obj, Spider) and
+                    obj is not Spider and
+                    getattr(obj, 'name', None) == spider_info.name):
+                return obj
+
+        return None
+
+    def get_all_spiders(self) -> List[SpiderRec]:
         """Get list of all detected spiders"""
         return self.detected_spiders
 
-    def get_spider_by_name(self, name: str) -> Optional[Dict]:
+    def get_spider_by_name(self, name: str) -> Optional[SpiderRec]:
         """Get spider info by name"""
         for spider in self.detected_spiders:
-            if spider['name'] == name:
+            if spider.name == name:
                 return spider
         return None
 
-    def get_spider_by_index(self, index: int) -> Optional[Dict]:
+    def get_spider_by_index(self, index: int) -> Optional[SpiderRec]:
         """Get spider info by index"""
         if 0 <= index < len(self.detected_spiders):
             return self.detected_spiders[index]
@@ -137,6 +261,15 @@ class SpiderManager:
             print(f"[!] Spider '{spider_name}' not found!")
             return False
 
+        # Import Scrapy and the spider module only now that we actually run
+        from scrapy.utils.project import get_project_settings
+        from scrapy.crawler import CrawlerProcess
+
+        spider_class = self._load_spider_class(spider_info)
+        if not spider_class:
+            print(f"[!] Could not load spider class for '{spider_name}'!")
+            return False
+
         # Get settings
         os.chdir(self.project_dir)
         settings = get_project_settings()
@@ -147,7 +280,7 @@ class SpiderManager:
 
         # Add spider with arguments
         spider_args = spider_args or {}
-        process.crawl(spider_info['class'], **spider_args)
+        process.crawl(spider_class, **spider_args)
 
         # Start crawling
         try:
@@ -194,9 +327,92 @@ class SpiderManager:
             traceback.print_exc()
             return False
 
+    def _find_kaggle_links_output(self) -> Optional[str]:
+        """Find the most recent kaggle_links output file, if any"""
+        import glob
+        output_dir = self.project_dir / 'output'
+        json_pattern = str(output_dir / 'kaggle_links_*.json')
+        matching_files = glob.glob(json_pattern)
+
+        if matching_files:
+            return max(matching_files, key=os.path.getctime)
+        return None
+
+    async def _run_spider_async(self, spider_name: str, spider_args: Optional[Dict] = None) -> bool:
+        """
+        Run a spider subprocess without blocking the event loop
+
+        Args:
+            spider_name: Name of the spider to run
+            spider_args: Optional arguments to pass to the spider
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Build command to run spider via run.py (same as run_spider_subprocess)
+        cmd = [sys.executable, 'run.py', spider_name]
+
+        if spider_args:
+            args_str = ','.join([f'{k}={v}' for k, v in spider_args.items()])
+            cmd.extend(['-a', args_str])
+
+        try:
+            process = await asyncio.create_subprocess_exec(*cmd, cwd=self.project_dir)
+            returncode = await process.wait()
+            return returncode == 0
+
+        except Exception as e:
+            print(f"\n[!] Error running spider '{spider_name}': {e}")
+            import traceback
+            traceback.print_exc()
+            return False
+
+    async def _run_all_async(self) -> List[tuple]:
+        """
+        Run all independent spiders concurrently, chaining kaggle_metadata
+        after kaggle_links so it can consume its output
+
+        Returns:
+            List of (spider_name, success) tuples in detection order
+        """
+        results_by_name = {}
+
+        # kaggle_metadata depends on kaggle_links output, so it runs after
+        # the concurrent batch; everything else overlaps network I/O
+        independent = [s for s in self.detected_spiders if s.name != 'kaggle_metadata']
+
+        if independent:
+            tasks = [
+                asyncio.create_task(self._run_spider_async(spider.name))
+                for spider in independent
+            ]
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+            for spider, outcome in zip(independent, outcomes):
+                results_by_name[spider.name] = outcome is True
+
+        # Chain kaggle_metadata after the batch using the freshest output
+        has_metadata = any(s.name == 'kaggle_metadata' for s in self.detected_spiders)
+        if has_metadata:
+            kaggle_links_output = self._find_kaggle_links_output()
+
+            if kaggle_links_output:
+                print(f"[+] Using kaggle_links output: {kaggle_links_output}")
+                success = await self._run_spider_async(
+                    'kaggle_metadata',
+                    {'input_file': kaggle_links_output}
+                )
+            else:
+                print("[!] Warning: No kaggle_links output found. Running without input file...")
+                success = await self._run_spider_async('kaggle_metadata')
+
+            results_by_name['kaggle_metadata'] = success
+
+        return [(s.name, results_by_name.get(s.name, False)) for s in self.detected_spiders]
+
     def run_all_spiders(self) -> List[tuple]:
         """
-        Run all spiders in sequence, with smart chaining for kaggle spiders
+        Run all spiders concurrently, with smart chaining for kaggle spiders
 
         Returns:
             List of (spider_name, success) tuples
@@ -205,55 +421,4 @@ class SpiderManager:
             print("[!] No spiders detected!")
             return []
 
-        results = []
-        kaggle_links_output = None
-
-        for spider in self.detected_spiders:
-            # Special handling for kaggle_metadata spider
-            if spider['name'] == 'kaggle_metadata':
-                # Check if we just ran kaggle_links spider
-                if kaggle_links_output:
-                    print(f"[+] Using output from kaggle_links spider: {kaggle_links_output}")
-                    success = self.run_spider_subprocess(
-                        spider['name'],
-                        {'input_file': kaggle_links_output}
-                    )
-                else:
-                    # Look for most recent kaggle_links output
-                    import glob
-                    output_dir = self.project_dir / 'output'
-                    json_pattern = str(output_dir / 'kaggle_links_*.json')
-                    matching_files = glob.glob(json_pattern)
-
-                    if matching_files:
-                        most_recent = max(matching_files, key=os.path.getctime)
-                        print(f"[+] Found recent kaggle_links output: {most_recent}")
-                        success = self.run_spider_subprocess(
-                            spider['name'],
-                            {'input_file': most_recent}
-                        )
-                    else:
-                        print("[!] Warning: No kaggle_links output found. Running without input file...")
-                        success = self.run_spider_subprocess(spider['name'])
-            else:
-                # Run normally
-                success = self.run_spider_subprocess(spider['name'])
-
-                # If this was kaggle_links spider, find its output file
-                if spider['name'] == 'kaggle_links' and success:
-                    import glob
-                    import time
-                    # Wait a moment for file to be written
-                    time.sleep(1)
-                    output_dir = self.project_dir / 'output'
-                    json_pattern = str(output_dir / 'kaggle_links_*.json')
-                    matching_files = glob.glob(json_pattern)
-
-                    if matching_files:
-                        # Get the most recent file (should be the one we just created)
-                        kaggle_links_output = max(matching_files, key=os.path.getctime)
-                        print(f"[+] Kaggle links output saved to: {kaggle_links_output}")
-
-            results.append((spider['name'], success))
-
-        return results
+        return asyncio.run(self._run_all_async())
@@ -37,10 +37,28 @@ class KaggleLinksSpider(scrapy.Spider):
         super().__init__(*args, **kwargs)
         self.max_pages = int(max_pages)
         self.current_page = 1
+        # Plain set: at max_pages * ~20 links per page the working set
+        # stays in the low thousands, well below where a Bloom-filter
+        # prefilter would beat a single set lookup
         self.seen_urls = set()
         self.seen_page_content_hashes = set()  # Track page content by hash
         self.selectors = get_selectors_for_site('kaggle')
         self.previous_first_model = None  # Track first model URL to detect page change
+        # Next-button locators, built once instead of re-allocating the
+        # (By, selector) tuples on every pagination step.
+        # Prioritize more reliable selectors first
+        self._next_button_locators = [
+            # Most reliable - CSS selector with aria-label
+            (By.CSS_SELECTOR, 'button[aria-label="Go to next page"]'),
+            # Second most reliable - CSS with class
+            (By.CSS_SELECTOR, 'button.MuiPaginationItem-previousNext:not([disabled])'),
+            # XPath alternatives
+            (By.XPATH, '//button[@aria-label="Go to next page"]'),
+            (By.XPATH, '//nav//button[contains(@class, "MuiPaginationItem-previousNext") and not(@disabled)]'),
+            # Config selectors as fallback
+            (By.XPATH, self.selectors.get('next_button_xpath')),
+            (By.XPATH, self.selectors.get('next_button_alt_xpath')),
+        ]
     
     def start_requests(self):
         """Generate initial request with Selenium enabled"""
@@ -214,21 +232,7 @@ class KaggleLinksSpider(scrapy.Spider):
             True if next page is available, False otherwise
         """
         # Try multiple selectors to find the next button
-        # Prioritize more reliable selectors first
-        selectors = [
-            # Most reliable - CSS selector with aria-label
-            (By.CSS_SELECTOR, 'button[aria-label="Go to next page"]'),
-            # Second most reliable - CSS with class
-            (By.CSS_SELECTOR, 'button.MuiPaginationItem-previousNext:not([disabled])'),
-            # XPath alternatives
-            (By.XPATH, '//button[@aria-label="Go to next page"]'),
-            (By.XPATH, '//nav//button[contains(@class, "MuiPaginationItem-previousNext") and not(@disabled)]'),
-            # Config selectors as fallback
-            (By.XPATH, self.selectors.get('next_button_xpath')),
-            (By.XPATH, self.selectors.get('next_button_alt_xpath')),
-        ]
-        
-        for by_type, selector in selectors:
+        for by_type, selector in self._next_button_locators:
             try:
                 next_button = driver.find_element(by_type, selector)
                 
@@ -274,21 +278,7 @@ class KaggleLinksSpider(scrapy.Spider):
         from my_scraper.extractors.selenium_utils import scroll_element_into_view
         
         # Try multiple strategies to click the next button
-        # Prioritize more reliable selectors first
-        selectors = [
-            # Most reliable - CSS selector with aria-label
-            (By.CSS_SELECTOR, 'button[aria-label="Go to next page"]'),
-            # Second most reliable - CSS with class
-            (By.CSS_SELECTOR, 'button.MuiPaginationItem-previousNext:not([disabled])'),
-            # XPath alternatives
-            (By.XPATH, '//button[@aria-label="Go to next page"]'),
-            (By.XPATH, '//nav//button[contains(@class, "MuiPaginationItem-previousNext") and not(@disabled)]'),
-            # Config selectors as fallback
-            (By.XPATH, self.selectors.get('next_button_xpath')),
-            (By.XPATH, self.selectors.get('next_button_alt_xpath')),
-        ]
-        
-        for by_type, selector in selectors:
+        for by_type, selector in self._next_button_locators:
             try:
                 # Wait for element to be present and clickable
                 wait = WebDriverWait(driver, 5)
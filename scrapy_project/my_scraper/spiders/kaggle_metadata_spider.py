@@ -18,7 +18,7 @@ from lxml import html as lxml_html
 from my_scraper.items import KaggleMetadataItem, TransformersVariationItem
 from my_scraper.utils import html_to_text
 from my_scraper.selectors.site_selectors import get_selectors_for_site
-from my_scraper.extractors.selenium_utils import parse_tree_from_response, click_element
+from my_scraper.extractors.selenium_utils import click_element, prefetch_dom, refresh_tree
 from my_scraper.extractors.description_extractor import extract_description
 from my_scraper.extractors.downloads_extractor import extract_downloads
 from my_scraper.extractors.usability_extractor import extract_usability
@@ -197,8 +197,9 @@ class KaggleMetadataSpider(scrapy.Spider):
             return
 
         try:
-            # Parse tree from the response
-            tree = parse_tree_from_response(response)
+            # Fetch and parse the live DOM once; extractors share the
+            # cached tree and only re-parse after a real DOM change
+            tree = prefetch_dom(driver)
 
             # Create item
             item = KaggleMetadataItem()
@@ -260,8 +261,8 @@ class KaggleMetadataSpider(scrapy.Spider):
             try:
                 if click_element(driver, action_selector):
                     time.sleep(1)
-                    # Refresh tree after click (using driver's page source)
-                    tree = lxml_html.fromstring(driver.page_source)
+                    # Refresh tree after click (re-parses only if changed)
+                    tree = refresh_tree(driver)
             except Exception:
                 pass
         
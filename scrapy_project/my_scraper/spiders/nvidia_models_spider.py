@@ -16,12 +16,11 @@ from my_scraper.items import NvidiaModelItem
 from my_scraper.selectors.site_selectors import get_selectors_for_site
 from my_scraper.extractors.selenium_utils import parse_tree_from_response
 from my_scraper.extractors.nvidia_tags_extractor import extract_nvidia_tags
-from my_scraper.extractors.nvidia_modelcard_extractor import extract_modelcard
-from my_scraper.extractors.nvidia_url_extractor import (
-    extract_model_name_from_card,
-    extract_model_url_from_card,
-    extract_parent_container,
+from my_scraper.extractors.nvidia_modelcard_extractor import (
+    extract_modelcard,
+    extract_modelcard_from_html,
 )
+from my_scraper.extractors.nvidia_url_extractor import bulk_extract_cards
 
 
 class NvidiaModelsSpider(scrapy.Spider):
@@ -153,32 +152,27 @@ class NvidiaModelsSpider(scrapy.Spider):
             all_items = []
 
             self.logger.info('STEP 1: Extracting all model data from main page...')
-            for idx in range(final_card_count):
-                try:
-                    # Re-find all cards in each iteration to avoid stale references
-                    model_cards = driver.find_elements(By.CSS_SELECTOR, model_cards_selector)
-
-                    # Check if current card index is still valid
-                    if idx >= len(model_cards):
-                        self.logger.warning(f'Card at index {idx} no longer available (have {len(model_cards)} cards)')
-                        continue
 
-                    card = model_cards[idx]
-
-                    # Extract model name using extractor
-                    model_name = extract_model_name_from_card(
-                        card, driver, self.selectors, model_cards_selector, idx
-                    )
+            # Read name, URL and parent container for every card in a
+            # single JS round trip instead of several WebDriver commands
+            # per card - the atomic read also avoids stale references
+            card_entries = bulk_extract_cards(
+                driver, model_cards_selector,
+                self.selectors.get('model_name_attr', 'title'),
+                self.selectors.get('model_url_attr', 'href')
+            )
 
+            for entry in card_entries:
+                idx = entry.get('idx', 0)
+                try:
+                    model_name = entry.get('name')
                     if not model_name:
+                        self.logger.warning(f'Model card {idx + 1} has no name attribute')
                         continue
 
-                    # Extract model URL using extractor
-                    model_url = extract_model_url_from_card(
-                        card, driver, self.selectors, model_cards_selector, idx, model_name
-                    )
-
+                    model_url = entry.get('url')
                     if not model_url:
+                        self.logger.warning(f'Model {model_name} has no URL attribute')
                         continue
 
                     # Check for duplicates - skip if already processed
@@ -207,12 +201,10 @@ class NvidiaModelsSpider(scrapy.Spider):
                     item['scraped_on'] = datetime.now().isoformat()
 
                     # Extract tags for this model
-                    # Note: We need to find the parent container of the card to locate tags
+                    # Note: We need the parent container of the card to locate tags
                     try:
-                        # Extract parent container using extractor
-                        parent_container = extract_parent_container(
-                            card, driver, idx, model_name, model_cards_selector
-                        )
+                        # Parent container was resolved in the bulk read
+                        parent_container = entry.get('parent')
 
                         if parent_container:
                             # Scroll the container into view to ensure tags are visible
@@ -341,8 +333,14 @@ class NvidiaModelsSpider(scrapy.Spider):
             return
 
         try:
-            # Extract model card using extractor
-            item['model_card'] = extract_modelcard(driver, self.selectors, model_name)
+            # First pass: extract from the captured page source with no
+            # WebDriver commands; fall back to the Selenium path only
+            # when the content is not in the static HTML
+            item['model_card'] = extract_modelcard_from_html(
+                response.text, self.selectors, model_name
+            )
+            if not item['model_card']:
+                item['model_card'] = extract_modelcard(driver, self.selectors, model_name)
 
             # Log final summary
             tags_count = len(item.get('tags', [])) if item.get('tags') else 0
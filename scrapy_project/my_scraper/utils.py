@@ -3,18 +3,101 @@ Utility functions for web scraping
 Contains text cleaning, HTML parsing, and common helper functions
 """
 
+import functools
 import re
 import logging
-from lxml import html
+from lxml import etree, html
+from lxml.cssselect import CSSSelector
 from typing import Optional, List
 from my_scraper.selectors.site_selectors import GeneralSelectors
 
 
+@functools.lru_cache(maxsize=256)
+def compile_css(selector: str) -> CSSSelector:
+    """
+    Compile (and cache) a CSS selector for direct lxml tree evaluation
+
+    Args:
+        selector: CSS selector string
+
+    Returns:
+        Compiled CSSSelector callable
+    """
+    return CSSSelector(selector)
+
+
+@functools.lru_cache(maxsize=256)
+def compile_xpath(expression: str) -> etree.XPath:
+    """
+    Compile (and cache) an XPath expression
+
+    Selector strings come from static config, so each expression is
+    parsed by libxml2 once instead of on every page.
+
+    Args:
+        expression: XPath expression string
+
+    Returns:
+        Compiled etree.XPath callable
+    """
+    return etree.XPath(expression)
+
+
+@functools.lru_cache(maxsize=64)
+def _classify_selectors_cached(selectors: tuple) -> tuple:
+    """Classification worker, cached per distinct selector tuple"""
+    # XPath expressions start with an axis step or a grouped expression;
+    # everything else (.cls, #id, tag, tag[attr], tag.cls ...) is CSS
+    return tuple((not s.startswith(('/', '(', './')), s)
+                 for s in selectors)
+
+
+def classify_selectors(selectors: List[str]) -> tuple:
+    """
+    Classify selector strings as CSS or XPath once, up front
+
+    Selector lists come from static config, so the classification for a
+    given list is computed once and reused across every page.
+
+    Args:
+        selectors: List of selector strings
+
+    Returns:
+        Tuple of (is_css, selector) tuples
+    """
+    return _classify_selectors_cached(tuple(selectors))
+
+
+def xpath_texts(tree, selector: str) -> List[str]:
+    """
+    Get stripped text for every node an XPath selector matches
+
+    For plain element selectors the text nodes are collected inside
+    libxml2 in a single traversal instead of one text_content() call per
+    matched element. Selectors that already produce strings (text() or
+    string(...) steps) are evaluated as-is.
+
+    Args:
+        tree: lxml tree to evaluate against
+        selector: XPath selector string
+
+    Returns:
+        List of stripped text strings (may contain empty strings)
+    """
+    if 'text()' in selector or 'string(' in selector:
+        return [str(t).strip() for t in compile_xpath(selector)(tree)]
+    return [str(t).strip()
+            for t in compile_xpath(f"({selector})/descendant-or-self::*/text()")(tree)]
+
+
+@functools.lru_cache(maxsize=1024)
 def html_to_text(html_snippet: str) -> str:
     """
     Convert an HTML snippet (outerHTML) into cleaned plain text.
 
     Uses lxml to parse and extract text_content(), then collapses whitespace.
+    Results are memoized - retries and overlapping selector fallbacks often
+    hand in the identical outerHTML.
     
     Args:
         html_snippet: HTML string to convert
@@ -37,6 +120,16 @@ def html_to_text(html_snippet: str) -> str:
     return text
 
 
+# Patterns from config plus the historical fallback indicators, compiled
+# once into a single alternation - is_numeric_value runs on every
+# candidate span in the downloads fallback
+_NUMERIC_VALUE_RE = re.compile(
+    '|'.join(GeneralSelectors.NUMERIC_PATTERNS) +
+    r'|\d+[KkMmBb]?'
+    r'|(?s:(?=.*\d).*[KM])'
+)
+
+
 def is_numeric_value(text: str) -> bool:
     """
     Check if text represents a numeric value (including K/M suffixes)
@@ -50,16 +143,10 @@ def is_numeric_value(text: str) -> bool:
     # Simple digit check
     if text.isdigit():
         return True
-    
-    # Check against numeric patterns from config
-    for pattern in GeneralSelectors.NUMERIC_PATTERNS:
-        if re.match(pattern, text):
-            return True
-    
-    # Fallback: check for common download indicators
-    return bool(re.match(r'\d+[KkMmBb]?', text) or 
-               ('K' in text and any(char.isdigit() for char in text)) or
-               ('M' in text and any(char.isdigit() for char in text)))
+
+    # Single precompiled alternation instead of a per-call loop over
+    # uncompiled config patterns plus ad-hoc substring scans
+    return _NUMERIC_VALUE_RE.match(text) is not None
 
 
 def clean_text(text: str) -> str: